@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, Query, Request, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc, text, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from backend.models.reddit import RedditPost
 from backend.database.config import get_db
 from backend.api.schemas.posts import (
@@ -275,24 +276,11 @@ async def scrape_subreddit(
         
         logger.info(f"✅ Fetched {len(posts)} posts from r/{subreddit}")
         
-        # Step 2: Check for duplicates and save to database
-        saved_count = 0
-        skipped_count = 0
-        
+        # Step 2: Build column values for each post
+        rows = []
         for post_data in posts:
             try:
-                # Check if post already exists
-                existing = await db.execute(
-                    select(RedditPost).where(RedditPost.post_id == post_data['post_id'])
-                )
-                
-                if existing.scalar_one_or_none():
-                    skipped_count += 1
-                    logger.debug(f"⏭️  Skipped duplicate post: {post_data['post_id']}")
-                    continue
-                
-                # Create new post record
-                reddit_post = RedditPost(
+                rows.append(dict(
                     post_id=post_data['post_id'],
                     subreddit=post_data['subreddit'],
                     title=post_data['title'],
@@ -307,17 +295,23 @@ async def scrape_subreddit(
                     link_flair_text=post_data['link_flair_text'],
                     tickers=[],  # Will be extracted by sentiment service
                     sentiment_score=None  # Will be calculated by sentiment service
-                )
-                
-                db.add(reddit_post)
-                saved_count += 1
-                logger.debug(f"✏️  Added post: {post_data['post_id']}")
-                
-            except Exception as e:
-                logger.error(f"❌ Error saving post {post_data.get('post_id')}: {e}")
-                continue
+                ))
+            except KeyError as e:
+                logger.error(f"❌ Error saving post {post_data.get('post_id')}: missing {e}")
+        
+        # Step 3: One Core bulk insert; posts already stored are skipped by
+        # ON CONFLICT and RETURNING reports which rows were actually new
+        saved_count = 0
+        if rows:
+            result = await db.execute(
+                pg_insert(RedditPost.__table__)
+                .on_conflict_do_nothing(index_elements=['post_id'])
+                .returning(RedditPost.__table__.c.post_id),
+                rows
+            )
+            saved_count = len(result.scalars().all())
+        skipped_count = len(rows) - saved_count
         
-        # Step 3: Commit all saves
         await db.commit()
         logger.info(f"✅ Saved {saved_count} posts to database")
         
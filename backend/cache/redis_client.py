@@ -259,6 +259,27 @@ class RedisCache:
         value = await self.get(CacheKeys.stock_price(ticker))
         return float(value) if value is not None else None
     
+    async def get_stock_prices(self, tickers: List[str]) -> dict:
+        """
+        Get cached prices for several tickers with a single MGET.
+        
+        Returns {ticker: price} for hits only; empty if cache unavailable.
+        """
+        if not self.is_connected or not tickers:
+            return {}
+        
+        try:
+            values = await self._client.mget([CacheKeys.stock_price(t) for t in tickers])
+        except Exception as e:
+            logger.warning(f"Cache MGET error for {len(tickers)} prices: {e}")
+            return {}
+        
+        return {
+            ticker: float(value)
+            for ticker, value in zip(tickers, values)
+            if value is not None
+        }
+    
     async def set_stock_price(self, ticker: str, price: float) -> bool:
         """Cache stock price with 5-min TTL."""
         return await self.set(
@@ -8,8 +8,12 @@ Tasks include:
 - ML model training
 - Signal monitoring
 """
+import asyncio
+from typing import Any, Coroutine, Optional
+
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
 from backend.config.settings import settings
 
 # Initialize Celery app
@@ -122,5 +126,55 @@ app.conf.beat_schedule = {
     },
 }
 
+# ─────────────────────────────────────────────────────────────────────
+# Shared event loop for async tasks
+# ─────────────────────────────────────────────────────────────────────
+#
+# asyncpg connections (and the redis.asyncio client) are bound to the loop
+# that created them, so asyncio.run() per task would throw away the DB pool
+# every run. Each worker process keeps one loop instead and disposes the
+# pool only when the process exits.
+
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run coro to completion on this process's shared event loop."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+    return _worker_loop.run_until_complete(coro)
+
+
+@worker_process_init.connect
+def _init_worker_loop(**kwargs):
+    """Start each forked worker with a fresh loop and no inherited DB connections."""
+    global _worker_loop
+    from backend.database.config import engine
+    
+    # Connections copied from the parent by fork must not be reused here
+    engine.sync_engine.dispose(close=False)
+    _worker_loop = asyncio.new_event_loop()
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_loop(**kwargs):
+    """Stop the enrichment process pool, close pooled DB/Redis connections,
+    then the loop, at worker exit."""
+    global _worker_loop
+    from backend.services.reddit_service import RedditService
+    
+    RedditService.shutdown_process_pool()
+    if _worker_loop is None or _worker_loop.is_closed():
+        return
+    from backend.database.config import engine
+    from backend.cache.redis_client import close_redis
+    
+    _worker_loop.run_until_complete(close_redis())
+    _worker_loop.run_until_complete(engine.dispose())
+    _worker_loop.close()
+    _worker_loop = None
+
+
 if __name__ == "__main__":
     app.start()
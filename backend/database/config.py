@@ -21,6 +21,11 @@ engine = create_async_engine(
     pool_pre_ping=True,      # validate connections before use
     connect_args={
         "ssl": "require",    # SSL required for Neon DB
+        # Hot lookups (dedup, latest price) repeat the same SQL, so keep
+        # their prepared statements around on every pooled connection:
+        # SQLAlchemy's adapter-level cache and asyncpg's own
+        "prepared_statement_cache_size": 256,
+        "statement_cache_size": 256,
     }
 )
 
@@ -222,19 +222,22 @@ async def analyze_quality_distribution(session: AsyncSession) -> Dict:
             }
         }
     """
-    # Quality tier distribution
-    tier_result = await session.execute(
+    # One pass: a row per tier plus a grand-total row (GROUPING(quality_tier) = 1)
+    result = await session.execute(
         text("""
             SELECT 
                 quality_tier,
+                GROUPING(quality_tier) as is_total,
                 COUNT(*) as count,
-                ROUND(100.0 * COUNT(*) / (SELECT COUNT(*) FROM reddit_posts), 2) as percentage,
-                ROUND(AVG(quality_score), 2) as avg_score,
+                COUNT(quality_score) as scored,
+                ROUND(AVG(quality_score)::numeric, 2) as avg_score,
                 MIN(quality_score) as min_score,
-                MAX(quality_score) as max_score
+                MAX(quality_score) as max_score,
+                ROUND(PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY quality_score)::numeric, 2) as median,
+                ROUND(STDDEV(quality_score)::numeric, 2) as stdev
             FROM reddit_posts
-            GROUP BY quality_tier
-            ORDER BY CASE 
+            GROUP BY GROUPING SETS ((quality_tier), ())
+            ORDER BY is_total, CASE 
                 WHEN quality_tier = 'poor' THEN 1
                 WHEN quality_tier = 'fair' THEN 2
                 WHEN quality_tier = 'good' THEN 3
@@ -243,41 +246,30 @@ async def analyze_quality_distribution(session: AsyncSession) -> Dict:
             END
         """)
     )
+    rows = result.all()
+    
+    # The grand-total row sorts last
+    stats_row = rows[-1]
+    total = stats_row.count
     
     quality_tiers = {}
-    for row in tier_result:
-        tier_name, count, percentage, avg_score, min_score, max_score = row
-        quality_tiers[tier_name] = {
-            'count': count,
-            'percentage': percentage,
-            'avg_score': float(avg_score) if avg_score else 0,
-            'min_score': float(min_score) if min_score else 0,
-            'max_score': float(max_score) if max_score else 0
+    for row in rows[:-1]:
+        quality_tiers[row.quality_tier] = {
+            'count': row.count,
+            'percentage': round(100.0 * row.count / total, 2),
+            'avg_score': float(row.avg_score) if row.avg_score else 0,
+            'min_score': float(row.min_score) if row.min_score else 0,
+            'max_score': float(row.max_score) if row.max_score else 0
         }
     
-    # Overall statistics
-    stats_result = await session.execute(
-        text("""
-            SELECT 
-                COUNT(*) as total,
-                MIN(quality_score) as min,
-                MAX(quality_score) as max,
-                ROUND(AVG(quality_score)::numeric, 2) as mean,
-                ROUND(PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY quality_score)::numeric, 2) as median,
-                ROUND(STDDEV(quality_score)::numeric, 2) as stdev
-            FROM reddit_posts
-            WHERE quality_score IS NOT NULL
-        """)
-    )
-    
-    stats_row = stats_result.first()
+    # Overall statistics cover scored posts only
     score_statistics = {
-        'total_posts': stats_row[0],
-        'min': float(stats_row[1]) if stats_row[1] else 0,
-        'max': float(stats_row[2]) if stats_row[2] else 0,
-        'mean': float(stats_row[3]) if stats_row[3] else 0,
-        'median': float(stats_row[4]) if stats_row[4] else 0,
-        'stdev': float(stats_row[5]) if stats_row[5] else 0
+        'total_posts': stats_row.scored,
+        'min': float(stats_row.min_score) if stats_row.min_score else 0,
+        'max': float(stats_row.max_score) if stats_row.max_score else 0,
+        'mean': float(stats_row.avg_score) if stats_row.avg_score else 0,
+        'median': float(stats_row.median) if stats_row.median else 0,
+        'stdev': float(stats_row.stdev) if stats_row.stdev else 0
     }
     
     return {
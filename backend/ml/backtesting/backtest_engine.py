@@ -136,7 +136,7 @@ class BacktestEngine:
         
         # Process each day (no lookahead bias)
         for day_idx, current_date in enumerate(unique_dates):
-            logger.debug(f"Processing {current_date}")
+            logger.debug("Processing %s", current_date)
             
             # Get predictions for this day only (historical data)
             day_predictions = predictions[predictions['date'] == current_date]
@@ -272,7 +272,7 @@ class BacktestEngine:
             
             # Skip weak signals
             if confidence < self.config.min_confidence:
-                logger.debug(f"Skipping {ticker}: low confidence {confidence:.2f}")
+                logger.debug("Skipping %s: low confidence %.2f", ticker, confidence)
                 continue
             
             # Skip neutral signals
@@ -316,7 +316,7 @@ class BacktestEngine:
                 'position_value': position_value
             }
             
-            logger.debug(f"Opened {signal:+.0f} position: {ticker} @ {entry_price:.2f}")
+            logger.debug("Opened %+.0f position: %s @ %.2f", signal, ticker, entry_price)
         
         return current_capital
     
@@ -406,7 +406,7 @@ class BacktestEngine:
         # Remove position
         del self.positions[ticker]
         
-        logger.debug(f"Closed position: {ticker} P&L={pnl:.2f} ({pnl_pct:.2%})")
+        logger.debug("Closed position: %s P&L=%.2f (%.2f%%)", ticker, pnl, pnl_pct * 100)
         
         return current_capital
         return current_capital
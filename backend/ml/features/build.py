@@ -252,7 +252,8 @@ class FeatureBuilder:
         """
         lookback_time = reference_date - timedelta(hours=self.sentiment_window_hours)
         
-        stmt = select(RedditPost).where(
+        # Only the two columns we aggregate; skips loading post bodies
+        stmt = select(RedditPost.tickers, RedditPost.sentiment_score).where(
             and_(
                 RedditPost.created_at >= lookback_time,
                 RedditPost.created_at <= reference_date
@@ -265,15 +266,13 @@ class FeatureBuilder:
         # Aggregate sentiment by ticker
         sentiment_data = {ticker: [] for ticker in tickers}
         
-        for row in posts:
-            post = row[0]  # Extract RedditPost object
-            if post.sentiment_score is not None:
+        for post_tickers, sentiment_score in posts:
+            if sentiment_score is not None:
                 # Post mentions multiple tickers
-                post_tickers = post.tickers or []
-                for ticker in post_tickers:
+                for ticker in post_tickers or []:
                     if ticker in tickers:
                         try:
-                            sentiment_val = float(post.sentiment_score)
+                            sentiment_val = float(sentiment_score)
                             sentiment_data[ticker].append(sentiment_val)
                         except (ValueError, TypeError):
                             pass
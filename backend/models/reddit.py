@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ARRAY, Index, Float, Numeric, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ARRAY, JSON, Index, Float, Numeric, Boolean
 from sqlalchemy.sql import func
 from backend.database.config import Base
 
@@ -16,7 +16,7 @@ class RedditPost(Base):
     upvote_ratio = Column(Float, default=0.0)  # NEW: 0.0-1.0 upvote percentage
     is_self = Column(Boolean, default=True)  # NEW: True=text post, False=link
     link_flair_text = Column(String(100))  # NEW: Post flair tag
-    tickers = Column(ARRAY(String), server_default='{}')
+    tickers = Column(ARRAY(String).with_variant(JSON(), 'sqlite'), server_default='{}')  # JSON list on SQLite (tests)
     sentiment_score = Column(Numeric(precision=5, scale=4), default=0.0)
     quality_score = Column(Float, default=0.0, index=True)  # 0-100 quality assessment (indexed)
     quality_tier = Column(String(20), default='fair')  # poor/fair/good/excellent
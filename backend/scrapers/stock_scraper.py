@@ -1,43 +1,90 @@
 import yfinance as yf
 import pandas as pd
+from curl_cffi import requests as curl_requests
 import pandas_ta as ta
 import asyncio
+import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Literal, Optional, Union
 from backend.utils.logger import logger
 from backend.utils.retry import retry_with_backoff, YFINANCE_CONFIG, should_retry
 
+if TYPE_CHECKING:
+    import pyarrow
+
+
+OutputFormat = Literal['dict', 'arrow']
+
+# DataFrame column -> price record field for the indicator columns
+INDICATOR_FIELDS = {
+    'RSI': 'rsi',
+    'MACD': 'macd',
+    'MACD_Signal': 'macd_signal',
+    'BB_Upper': 'bb_upper',
+    'BB_Lower': 'bb_lower',
+    'SMA_50': 'sma_50',
+    'SMA_200': 'sma_200',
+    'Volume_Ratio': 'volume_ratio',
+}
+
 
 class StockScraper:
     """Fetches stock prices and calculates momentum indicators for swing trading"""
     
+    # Current prices are reused within this window (seconds) per process
+    PRICE_CACHE_SECONDS = 15
+    
+    # Concurrent Yahoo requests per fetch_multiple call; unbounded fan-out
+    # triggers 429s (retried with backoff by _fetch_sync's decorator)
+    MAX_CONCURRENT_FETCHES = 8
+    
     def __init__(self):
-        self._session = None
+        # One HTTP session for every yf.Ticker this scraper creates, so
+        # connections, TLS state and Yahoo cookies are reused across calls.
+        # yfinance >= 1.0 needs a curl_cffi session (browser impersonation).
+        self._session = curl_requests.Session(impersonate="chrome")
+        # Keyed by (ticker, time bucket) so entries expire when the bucket rolls over
+        self._cached_price = lru_cache(maxsize=4096)(self._get_price_for_bucket)
     
     async def fetch_historical(
         self, 
         ticker: str, 
         period: str = "3mo",  # Need 200 days for SMA_200
-        calculate_indicators: bool = True
-    ) -> List[Dict]:
-        """Fetch historical data with technical indicators for swing trading"""
+        calculate_indicators: bool = True,
+        output: OutputFormat = 'dict'
+    ) -> Union[List[Dict], "pyarrow.Table"]:
+        """Fetch historical data with technical indicators for swing trading
+        
+        ``output='arrow'`` returns a pyarrow.Table with the same fields as the
+        dict records, for consumers that bulk-load or serialize columnar data.
+        """
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
             None, 
             self._fetch_sync, 
-            ticker, period, calculate_indicators
+            ticker, period, calculate_indicators, output
         )
     
     @retry_with_backoff(config=YFINANCE_CONFIG)
-    def _fetch_sync(self, ticker: str, period: str, calc_indicators: bool) -> List[Dict]:
+    def _fetch_sync(
+        self,
+        ticker: str,
+        period: str,
+        calc_indicators: bool,
+        output: OutputFormat = 'dict'
+    ) -> Union[List[Dict], "pyarrow.Table"]:
         """Synchronous fetching (runs in thread pool)"""
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=self._session)
             df = stock.history(period=period)
             
             if df.empty:
                 logger.warning(f"No data returned for {ticker}")
-                return []
+                return self._empty_result(output)
+            
+            # Cast once so itertuples yields Python ints for volume below
+            df['Volume'] = df['Volume'].fillna(0).astype('int64')
             
             # Calculate technical indicators for momentum trading
             if calc_indicators:
@@ -69,31 +116,44 @@ class StockScraper:
                 df['Volume_Avg_20'] = df['Volume'].rolling(window=20).mean()
                 df['Volume_Ratio'] = df['Volume'] / df['Volume_Avg_20']
             
-            # Convert to list of dicts
+            # Convert to list of dicts. itertuples yields plain tuples instead
+            # of boxing each row into a Series; reindex fills any indicator
+            # column pandas_ta did not produce with NaN.
+            symbol = ticker.upper()
+            indicator_cols = list(INDICATOR_FIELDS) if calc_indicators else []
+            rows = df.reindex(columns=['Open', 'High', 'Low', 'Close', 'Volume'] + indicator_cols)
+            
+            if output == 'arrow':
+                return self._to_arrow(symbol, rows)
+            
             prices = []
-            for date, row in df.iterrows():
+            for date, open_, high, low, close, volume, *indicators in rows.itertuples(index=True, name=None):
                 price_data = {
-                    'ticker': ticker.upper(),
+                    'ticker': symbol,
                     'date': date.to_pydatetime(),
-                    'open_price': float(row['Open']),  # Fixed field name
-                    'high': float(row['High']),
-                    'low': float(row['Low']),
-                    'close': float(row['Close']),
-                    'adjusted_close': float(row['Close']),  # Added
-                    'volume': int(row['Volume']),
+                    'open_price': float(open_),  # Fixed field name
+                    'high': float(high),
+                    'low': float(low),
+                    'close': float(close),
+                    'adjusted_close': float(close),  # Added
+                    'volume': volume,
                 }
                 
-                # Add indicators if calculated
+                # Add indicators if calculated (v != v is the NaN check; pandas_ta
+                # returns None instead of a series when history is too short)
                 if calc_indicators:
+                    rsi, macd_, macd_signal, bb_upper, bb_lower, sma_50, sma_200, volume_ratio = (
+                        None if v is None or v != v else float(v) for v in indicators
+                    )
                     price_data.update({
-                        'rsi': float(row['RSI']) if pd.notna(row['RSI']) else None,
-                        'macd': float(row['MACD']) if pd.notna(row.get('MACD')) else None,
-                        'macd_signal': float(row['MACD_Signal']) if pd.notna(row.get('MACD_Signal')) else None,
-                        'bb_upper': float(row['BB_Upper']) if pd.notna(row.get('BB_Upper')) else None,
-                        'bb_lower': float(row['BB_Lower']) if pd.notna(row.get('BB_Lower')) else None,
-                        'sma_50': float(row['SMA_50']) if pd.notna(row['SMA_50']) else None,
-                        'sma_200': float(row['SMA_200']) if pd.notna(row['SMA_200']) else None,
-                        'volume_ratio': float(row['Volume_Ratio']) if pd.notna(row['Volume_Ratio']) else None,
+                        'rsi': rsi,
+                        'macd': macd_,
+                        'macd_signal': macd_signal,
+                        'bb_upper': bb_upper,
+                        'bb_lower': bb_lower,
+                        'sma_50': sma_50,
+                        'sma_200': sma_200,
+                        'volume_ratio': volume_ratio,
                     })
                 
                 prices.append(price_data)
@@ -105,14 +165,39 @@ class StockScraper:
             # Re-raise transient errors so the retry decorator can handle them
             if should_retry(e):
                 raise  # Let the decorator retry
-            # For permanent errors (404, 401, etc.), log and return empty list
+            # For permanent errors (404, 401, etc.), log and return empty result
             logger.error(f"Error fetching {ticker}: {e}", exc_info=True)
-            return []
+            return self._empty_result(output)
+    
+    @staticmethod
+    def _empty_result(output: OutputFormat) -> Union[List[Dict], "pyarrow.Table"]:
+        """Empty list, or an empty table for arrow output"""
+        if output == 'arrow':
+            import pyarrow as pa
+            return pa.table({})
+        return []
+    
+    @staticmethod
+    def _to_arrow(symbol: str, rows: pd.DataFrame) -> "pyarrow.Table":
+        """Columnar equivalent of the dict records built in _fetch_sync"""
+        import pyarrow as pa
+        
+        frame = rows.rename(columns={
+            'Open': 'open_price', 'High': 'high', 'Low': 'low',
+            'Close': 'close', 'Volume': 'volume', **INDICATOR_FIELDS,
+        })
+        frame.insert(0, 'ticker', symbol)
+        frame.insert(1, 'date', rows.index.to_pydatetime())
+        frame.insert(6, 'adjusted_close', frame['close'])
+        # NaN -> null, matching the None values in dict records
+        return pa.Table.from_pandas(frame, preserve_index=False)
     
     async def fetch_multiple(
         self, 
         tickers: List[str], 
-        period: str = "3mo"
+        period: str = "3mo",
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None
     ) -> Dict[str, List[Dict]]:
         """
         Fetch data for multiple tickers in parallel.
@@ -120,34 +205,70 @@ class StockScraper:
         Args:
             tickers: List of stock symbols
             period: Time period for each ticker
+            timeout: Wall-clock budget in seconds for the whole batch;
+                tickers still pending when it expires get an empty list
+            max_concurrency: In-flight request cap (default MAX_CONCURRENT_FETCHES)
             
         Returns:
             Dictionary mapping ticker to price data list
         """
-        tasks = [self.fetch_historical(t, period) for t in tickers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filter out exceptions
-        output = {}
-        for ticker, result in zip(tickers, results):
-            if isinstance(result, Exception):
-                logger.error(f"Failed to fetch {ticker}: {result}")
-                output[ticker] = []
-            else:
-                output[ticker] = result
+        semaphore = asyncio.Semaphore(max_concurrency or self.MAX_CONCURRENT_FETCHES)
+        tasks: Dict[str, asyncio.Task] = {}
+        try:
+            async with asyncio.timeout(timeout):
+                async with asyncio.TaskGroup() as tg:
+                    for ticker in tickers:
+                        tasks[ticker] = tg.create_task(self._fetch_safe(ticker, period, semaphore))
+        except TimeoutError:
+            logger.error(f"fetch_multiple timed out after {timeout}s")
         
-        return output
+        return {
+            ticker: task.result() if task.done() and not task.cancelled() else []
+            for ticker, task in tasks.items()
+        }
+    
+    async def _fetch_safe(
+        self,
+        ticker: str,
+        period: str,
+        semaphore: asyncio.Semaphore
+    ) -> List[Dict]:
+        """fetch_historical that logs and swallows errors so one ticker
+        cannot cancel its siblings in the task group"""
+        try:
+            async with semaphore:
+                return await self.fetch_historical(ticker, period)
+        except Exception as e:
+            logger.error(f"Failed to fetch {ticker}: {e}")
+            return []
     
     async def fetch_current_price(self, ticker: str) -> Optional[float]:
-        """Get current market price"""
+        """Get current market price (memoized for PRICE_CACHE_SECONDS)"""
+        bucket = int(time.time() // self.PRICE_CACHE_SECONDS)
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._get_price_sync, ticker)
+        return await loop.run_in_executor(None, self._cached_price, ticker, bucket)
+    
+    def _get_price_for_bucket(self, ticker: str, bucket: int) -> Optional[float]:
+        """Cache-key adapter: bucket only partitions the LRU, it is not used"""
+        return self._get_price_sync(ticker)
     
     @retry_with_backoff(config=YFINANCE_CONFIG)
     def _get_price_sync(self, ticker: str) -> Optional[float]:
         """Synchronous price fetching"""
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(ticker, session=self._session)
+            
+            # fast_info hits a lightweight endpoint; .info pulls the full quoteSummary
+            try:
+                fast_info = stock.fast_info
+                price = fast_info.last_price or fast_info.previous_close
+                if price:
+                    return float(price)
+            except Exception as e:
+                if should_retry(e):
+                    raise
+                logger.debug(f"fast_info unavailable for {ticker}, falling back to info: {e}")
+            
             info = stock.info
             
             # Try multiple price fields
@@ -17,14 +17,19 @@ Quality tiers:
 
 import re
 import math
+import string
+from collections import Counter
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class QualityScore:
-    """Score breakdown for a single post"""
+    """Score breakdown for a single post (immutable, slotted for bulk ingestion)"""
     overall_score: float  # 0-100
     engagement_score: float  # 0-100
     content_score: float  # 0-100
@@ -32,8 +37,8 @@ class QualityScore:
     spam_score: float  # 0-100 (lower is better)
     is_quality: bool  # True if overall_score >= min_threshold
     quality_tier: str  # "poor", "fair", "good", "excellent"
-    reasons: List[str]  # Raw/marginal reasons
-    flags: List[str]  # Issues detected
+    reasons: Tuple[str, ...]  # Raw/marginal reasons
+    flags: Tuple[str, ...]  # Issues detected
 
 
 class QualityScorer:
@@ -71,10 +76,38 @@ class QualityScorer:
         'click here', 'limited time', 'act now', 'exclusive',
         'crypto pump', 'nft', 'coin', 'token', 'doge'
     }
+    # One alternation pass instead of a substring scan per keyword; word
+    # boundaries stop 'moon' matching inside 'afternoon'. Longest first so
+    # multi-word phrases win over their prefixes.
+    _SPAM_RE = re.compile(
+        r'\b(?:' + '|'.join(
+            re.escape(kw) for kw in sorted(SPAM_KEYWORDS, key=len, reverse=True)
+        ) + r')\b'
+    )
+    # Sentence terminators and URL schemes, counted by content and spam scoring
+    _SENTENCE_END_RE = re.compile(r'[.!?]+')
+    _URL_RE = re.compile(r'http[s]?://')
+    SPAM_EMOJI = frozenset('🚀💎🤑💰💸🌙⭐🔥💯👍👎')
+    # Translation table that deletes spam emoji; count = len before - len after
+    _EMOJI_TRANS = str.maketrans('', '', ''.join(SPAM_EMOJI))
+    # ASCII capitals, deleted with bytes.translate to count caps in C
+    _ASCII_UPPER = string.ascii_uppercase.encode('ascii')
     
     # Sentiment/engagement multipliers
     COMMENT_WEIGHT = 0.3  # Comments worth 30% vs upvotes
     
+    # Precomputed log-scale engagement scores indexed by count. The table is
+    # sized for the slower comment curve: log10(n + 1) * 20 first reaches
+    # 100 at n = 99,999, one entry before the end (the upvote curve caps at
+    # n = 2,154). The last entry is 100 on both curves, so larger counts
+    # clamp to it without changing the result.
+    ENGAGEMENT_TABLE_SIZE = 100_000
+    _UPVOTE_SCORES = np.minimum(100.0, np.log10(np.arange(ENGAGEMENT_TABLE_SIZE + 1) + 1) * 30)
+    _COMMENT_SCORES = np.minimum(100.0, np.log10(np.arange(ENGAGEMENT_TABLE_SIZE + 1) + 1) * 20)
+    # Python-list copies: list indexing returns floats without numpy boxing
+    _UPVOTE_SCORES_LIST = _UPVOTE_SCORES.tolist()
+    _COMMENT_SCORES_LIST = _COMMENT_SCORES.tolist()
+    
     def __init__(self, min_quality: int = 30):
         """
         Initialize quality scorer.
@@ -112,17 +145,22 @@ class QualityScorer:
         flags = []
         reasons = []
         
+        # Build the combined text once and share it across sub-scorers
+        full_text = f"{title} {body}"
+        full_text_lower = full_text.lower()
+        content_length = len(full_text.strip())
+        
         # Calculate individual scores
         engagement_score = self._score_engagement(
             upvotes, downvotes, comment_count, flags
         )
         content_score = self._score_content(
-            title, body, flags, reasons
+            body, content_length, flags, reasons
         )
         upvote_ratio_score = self._score_upvote_ratio(
             upvote_ratio, flags
         )
-        spam_score = self._score_spam(title, body, flags)
+        spam_score = self._score_spam(full_text, full_text_lower, flags)
         
         # Weighted overall score (0-100)
         overall_score = (
@@ -153,10 +191,153 @@ class QualityScorer:
             spam_score=round(spam_score, 2),
             is_quality=is_quality,
             quality_tier=quality_tier,
-            reasons=reasons,
-            flags=flags
+            # tuple() of an empty list returns the shared empty tuple
+            reasons=tuple(reasons),
+            flags=tuple(flags)
         )
     
+    def score_posts(self, posts: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized quality scoring for a batch of posts.
+        
+        Computes the same sub-scores as ``score_post`` on whole columns at
+        once instead of paying per-post Python overhead. Flags and reasons
+        are not produced; use ``score_post`` when the breakdown is needed.
+        
+        Args:
+            posts: DataFrame with columns ``title``, ``body``, ``upvotes``,
+                ``comment_count`` and ``upvote_ratio``
+        
+        Returns:
+            DataFrame indexed like ``posts`` with columns overall_score,
+            engagement_score, content_score, upvote_ratio_score, spam_score,
+            is_quality and quality_tier
+        """
+        title = posts['title'].fillna('').astype(str)
+        body = posts['body'].fillna('').astype(str)
+        upvotes = posts['upvotes'].to_numpy(dtype=np.float64)
+        comments = posts['comment_count'].to_numpy(dtype=np.float64)
+        ratio = posts['upvote_ratio'].to_numpy(dtype=np.float64)
+        
+        # Engagement
+        table_max = self.ENGAGEMENT_TABLE_SIZE
+        upvote_score = self._UPVOTE_SCORES[np.clip(upvotes, 0, table_max).astype(np.intp)]
+        comment_score = self._COMMENT_SCORES[np.clip(comments, 0, table_max).astype(np.intp)]
+        engagement = upvote_score * 0.7 + comment_score * self.COMMENT_WEIGHT
+        engagement = np.where(
+            (upvotes >= 20) & (comments >= 5),
+            np.minimum(100, engagement * 1.1),
+            engagement,
+        )
+        engagement = np.where(comments < self.MIN_COMMENT_COUNT, 20.0, engagement)
+        engagement = np.where(upvotes < self.MIN_UPVOTES, 0.0, engagement)
+        
+        # Content
+        full_text = title + ' ' + body
+        content_length = full_text.str.strip().str.len().to_numpy(dtype=np.float64)
+        length_score = np.minimum(
+            100, 20 + (np.log10(np.maximum(content_length, 1)) - 1.7) * 25
+        )
+        sentences = body.str.count(self._SENTENCE_END_RE).to_numpy() + 1
+        paragraphs = body.str.count('\n\n').to_numpy() + 1
+        length_score = np.where(sentences >= 3, np.minimum(100, length_score * 1.1), length_score)
+        length_score = np.where(paragraphs >= 2, np.minimum(100, length_score * 1.05), length_score)
+        content = np.select(
+            [content_length < self.MIN_CONTENT_LENGTH, content_length > self.MAX_CONTENT_LENGTH],
+            [0.0, 30.0],
+            default=length_score,
+        )
+        
+        # Upvote ratio
+        in_healthy = (ratio >= 0.5) & (ratio <= 0.95)
+        ratio_score = np.select(
+            [
+                ~((ratio >= 0) & (ratio <= 1)),
+                ratio < self.BRIGADING_THRESHOLD,
+                ratio > self.SUSPICIOUS_HIGH_RATIO,
+                in_healthy,
+            ],
+            [50.0, 20.0, 40.0, 100 - np.abs(ratio - 0.7) * 100],
+            default=50 + np.minimum(np.abs(ratio - 0.5), np.abs(ratio - 0.95)) * 50,
+        )
+        
+        # Spam
+        text_lower = full_text.str.lower()
+        text_length = np.maximum(1, text_lower.str.len().to_numpy(dtype=np.float64))
+        emoji_count = (
+            text_lower.str.len() - text_lower.str.translate(self._EMOJI_TRANS).str.len()
+        ).to_numpy(dtype=np.float64)
+        spam = np.select(
+            [emoji_count / text_length > self.MAX_EMOJI_RATIO, emoji_count > 3],
+            [40.0, 20.0],
+            default=0.0,
+        )
+        caps_count = np.fromiter(
+            (self._count_caps(text) for text in full_text),
+            dtype=np.float64,
+            count=len(full_text),
+        )
+        spam += np.where(caps_count / text_length > self.MAX_CAPS_RATIO, 30.0, 0.0)
+        keyword_hits = text_lower.str.findall(self._SPAM_RE).map(lambda hits: len(set(hits)))
+        spam += keyword_hits.to_numpy(dtype=np.float64) * 15.0
+        url_count = text_lower.str.count(self._URL_RE).to_numpy()
+        spam += np.select([url_count > 3, url_count > 1], [20.0, 10.0], default=0.0)
+        repetition = np.fromiter(
+            (self._max_word_freq_ratio(text) for text in text_lower),
+            dtype=np.float64,
+            count=len(text_lower),
+        )
+        spam += np.where(repetition > 0.15, 25.0, 0.0)
+        spam = np.minimum(100, spam)
+        
+        overall = (
+            engagement * 0.35 +
+            content * 0.30 +
+            ratio_score * 0.20 +
+            (100 - spam) * 0.15
+        )
+        quality_tier = np.select(
+            [
+                overall >= self.EXCELLENT_QUALITY_THRESHOLD,
+                overall >= self.GOOD_QUALITY_THRESHOLD,
+                overall >= self.MIN_QUALITY_THRESHOLD,
+            ],
+            ["excellent", "good", "fair"],
+            default="poor",
+        )
+        
+        return pd.DataFrame(
+            {
+                'overall_score': np.round(overall, 2),
+                'engagement_score': np.round(engagement, 2),
+                'content_score': np.round(content, 2),
+                'upvote_ratio_score': np.round(ratio_score, 2),
+                'spam_score': np.round(spam, 2),
+                'is_quality': overall >= self.min_quality,
+                'quality_tier': quality_tier,
+            },
+            index=posts.index,
+        )
+    
+    @staticmethod
+    def _max_word_freq_ratio(text: str) -> float:
+        """Share of the most frequent long word (0 for texts of 20 words or fewer)."""
+        words = text.split()
+        if len(words) <= 20:
+            return 0.0
+        # Ignore short words
+        word_freq = Counter(word for word in words if len(word) > 3)
+        max_freq = word_freq.most_common(1)[0][1] if word_freq else 0
+        return max_freq / len(words)
+    
+    @classmethod
+    def _count_caps(cls, text: str) -> int:
+        """Number of upper-case characters (bytes.translate fast path for ASCII)."""
+        if text.isascii():
+            raw = text.encode('ascii')
+            return len(raw) - len(raw.translate(None, cls._ASCII_UPPER))
+        return sum(map(str.isupper, text))
+    
     def _score_engagement(
         self,
         upvotes: int,
@@ -180,11 +361,11 @@ class QualityScorer:
         
         # Engagement scoring with diminishing returns
         # Logarithmic scale: 10 upvotes = 30 points, 100 = 60 points
-        upvote_score = min(100, math.log10(upvotes + 1) * 30)
+        upvote_score = self._UPVOTE_SCORES_LIST[min(int(upvotes), self.ENGAGEMENT_TABLE_SIZE)]
         
         # Comment score: factor in discussion depth
         # 5 comments = 20 points, 50 = 60 points
-        comment_score = min(100, math.log10(comment_count + 1) * 20)
+        comment_score = self._COMMENT_SCORES_LIST[min(int(comment_count), self.ENGAGEMENT_TABLE_SIZE)]
         
         # Combined score with weighting
         engagement_score = (upvote_score * 0.7) + (comment_score * self.COMMENT_WEIGHT)
@@ -197,17 +378,16 @@ class QualityScorer:
     
     def _score_content(
         self,
-        title: str,
         body: str,
+        content_length: int,
         flags: List[str],
         reasons: List[str]
     ) -> float:
         """
         Score content quality: length, relevance, completeness.
-        """
-        full_content = f"{title} {body}".strip()
-        content_length = len(full_content)
         
+        ``content_length`` is the length of the stripped "title body" text.
+        """
         # Minimum content length check
         if content_length < self.MIN_CONTENT_LENGTH:
             flags.append(f"Content too short: {content_length} < {self.MIN_CONTENT_LENGTH}")
@@ -226,7 +406,7 @@ class QualityScorer:
         )
         
         # Bonus for substantive content (paragraph breaks, multiple sentences)
-        sentences = len(re.split(r'[.!?]+', body))
+        sentences = len(self._SENTENCE_END_RE.split(body))
         paragraphs = len(body.split('\n\n'))
         
         if sentences >= 3:
@@ -283,24 +463,23 @@ class QualityScorer:
     
     def _score_spam(
         self,
-        title: str,
-        body: str,
+        full_text_original: str,
+        full_text: str,
         flags: List[str]
     ) -> float:
         """
         Score spam probability: emoji, caps, keywords.
         
+        ``full_text_original`` keeps the original case for caps detection;
+        ``full_text`` is its lowercased form used for keyword matching.
+        
         Returns inverse score (0-100, where 100 = high spam).
         """
-        # Keep original case for caps detection
-        full_text_original = f"{title} {body}"
-        # Lowercase for keyword matching
-        full_text = full_text_original.lower()
         spam_indicators = 0.0
         
         # 1. Emoji detection
-        emoji_count = len(re.findall(r'[🚀💎🤑💰💸🌙⭐🔥💯👍👎]', full_text))
         text_length = len(full_text)
+        emoji_count = text_length - len(full_text.translate(self._EMOJI_TRANS))
         emoji_ratio = emoji_count / max(1, text_length)
         
         if emoji_ratio > self.MAX_EMOJI_RATIO:
@@ -310,7 +489,7 @@ class QualityScorer:
             spam_indicators += 20
         
         # 2. All-caps detection (on original text to preserve case)
-        caps_count = sum(1 for c in full_text_original if c.isupper())
+        caps_count = self._count_caps(full_text_original)
         caps_ratio = caps_count / max(1, text_length)
         
         if caps_ratio > self.MAX_CAPS_RATIO:
@@ -318,13 +497,13 @@ class QualityScorer:
             spam_indicators += 30
         
         # 3. Spam keyword detection (on lowercased text)
-        for keyword in self.SPAM_KEYWORDS:
-            if keyword in full_text:
-                flags.append(f"Spam keyword detected: '{keyword}'")
-                spam_indicators += 15
+        # dict.fromkeys dedups while keeping first-seen order
+        for keyword in dict.fromkeys(self._SPAM_RE.findall(full_text)):
+            flags.append(f"Spam keyword detected: '{keyword}'")
+            spam_indicators += 15
         
         # 4. Suspicious URLs
-        url_count = len(re.findall(r'http[s]?://', full_text))
+        url_count = len(self._URL_RE.findall(full_text))
         if url_count > 3:
             flags.append(f"High URL count: {url_count}")
             spam_indicators += 20
@@ -333,17 +512,10 @@ class QualityScorer:
         
         # 5. Repetitive patterns (likely copy-paste spam)
         # Check for repeated phrases
-        words = full_text.split()
-        if len(words) > 20:
-            word_freq = {}
-            for word in words:
-                if len(word) > 3:  # Ignore short words
-                    word_freq[word] = word_freq.get(word, 0) + 1
-            
-            max_freq_ratio = max(word_freq.values(), default=0) / len(words)
-            if max_freq_ratio > 0.15:  # 15% of text is one word
-                flags.append(f"High word repetition: {max_freq_ratio:.0%}")
-                spam_indicators += 25
+        max_freq_ratio = self._max_word_freq_ratio(full_text)
+        if max_freq_ratio > 0.15:  # 15% of text is one word
+            flags.append(f"High word repetition: {max_freq_ratio:.0%}")
+            spam_indicators += 25
         
         # Cap spam score at 100
         spam_score = min(100, spam_indicators)
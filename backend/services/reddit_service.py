@@ -5,20 +5,41 @@ Scrapes real data only — no mocks. Uses:
 - India RSS feeds (India hype) — zero credentials
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import Optional, Literal
 import asyncio
+import multiprocessing
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 
+from backend.database.config import AsyncSessionLocal
 from backend.models.reddit import RedditPost
 from backend.scrapers.reddit_json_scraper import RedditJsonScraper
 from backend.scrapers.india_rss_scraper import IndiaRssScraper
 from backend.utils.ticker_extractor import extract_tickers
-from backend.utils.sentiment import analyze_sentiment
+from backend.utils.sentiment import analyze_sentiment, get_sentiment_analyzer
 from backend.utils.logger import logger
 from backend.services.quality_scorer import QualityScorer
 
 PostType = Literal['hot', 'new', 'rising', 'top']
 
+# Posts per process pool task; smaller batches are enriched in a thread
+ENRICH_CHUNK_SIZE = 500
+
+# Built once at import; SQLAlchemy caches the compiled SQL either way,
+# this only skips rebuilding the statement objects per call
+_EXISTING_POST_IDS = select(RedditPost.post_id).where(
+    RedditPost.post_id.in_(bindparam('post_ids', expanding=True))
+)
+# Core insert against the Table: no ORM unit-of-work or bulk-insert
+# bookkeeping per row, just an executemany over plain dicts
+_INSERT_POSTS = (
+    pg_insert(RedditPost.__table__)
+    .on_conflict_do_nothing(index_elements=['post_id'])
+    .returning(RedditPost.__table__.c.post_id)
+)
+
 
 class RedditService:
     """Scrapes Reddit (US) + RSS (India) and stores to DB.
@@ -28,6 +49,8 @@ class RedditService:
 
     DEFAULT_SUBREDDITS = ['wallstreetbets', 'stocks', 'options']
 
+    _process_pool: Optional[ProcessPoolExecutor] = None
+
     def __init__(self, min_quality: int = 50):
         self.scraper = RedditJsonScraper()
         self.india_scraper = IndiaRssScraper()
@@ -37,14 +60,20 @@ class RedditService:
 
     async def scrape_and_save(
         self,
-        db: AsyncSession,
+        db: Optional[AsyncSession] = None,
         subreddits: Optional[list[str]] = None,
         limit: int = 100,
         post_type: PostType = 'hot',
         time_filter: str = 'day',
         include_india: bool = True,
     ) -> dict:
-        """Scrape Reddit + India RSS, extract tickers/sentiment, save to DB."""
+        """Scrape Reddit + India RSS, extract tickers/sentiment, save to DB.
+
+        All posts are deduplicated with a single IN query and enriched in one
+        pass. With a caller-supplied db everything is then saved in one
+        transaction on that session; without one, each subreddit (and RSS
+        feed) is saved concurrently in its own AsyncSessionLocal() session.
+        """
         if subreddits is None:
             subreddits = self.DEFAULT_SUBREDDITS
 
@@ -58,14 +87,15 @@ class RedditService:
 
         results = await asyncio.gather(*scrape_tasks, return_exceptions=True)
 
-        # Collect all posts
-        all_posts: list[dict] = []
+        # Collect posts per subreddit
+        posts_by_sub: dict[str, list[dict]] = {}
         for i, sub in enumerate(subreddits):
             r = results[i]
             if isinstance(r, Exception):
                 logger.error(f"Failed to scrape r/{sub}: {r}")
             else:
-                all_posts.extend(r)
+                posts_by_sub[sub] = r
+        all_posts = [post for posts in posts_by_sub.values() for post in posts]
 
         # India RSS results (already have tickers + sentiment pre-computed)
         india_posts: list[dict] = []
@@ -76,36 +106,48 @@ class RedditService:
             else:
                 india_posts = r
 
-        # Phase 2: Process and save
-        saved, skipped, failed = 0, 0, 0
-        skip_reasons = {'no_tickers': 0, 'duplicate': 0, 'low_quality': 0}
-
-        # Process Reddit posts (need ticker extraction + sentiment)
-        for post in all_posts:
-            result = await self._process_and_save(db, post, extract=True, skip_reasons=skip_reasons)
-            if result == 'saved':
-                saved += 1
-            elif result == 'skipped':
-                skipped += 1
-            else:
-                failed += 1
-
-        # Process India RSS posts (tickers + sentiment already computed)
-        for post in india_posts:
-            result = await self._process_and_save(db, post, extract=False, skip_reasons=skip_reasons)
-            if result == 'saved':
-                saved += 1
-            elif result == 'skipped':
-                skipped += 1
-            else:
-                failed += 1
+        # Phase 2: Dedup every post with one IN query, then enrich in one pass
+        stats = {
+            'saved': 0, 'skipped': 0, 'failed': 0,
+            'skip_reasons': {'no_tickers': 0, 'duplicate': 0, 'low_quality': 0},
+        }
+        post_ids = [p['post_id'] for p in all_posts] + [p['post_id'] for p in india_posts]
+        if db is not None:
+            existing_ids = await self._existing_post_ids(db, post_ids)
+        else:
+            async with AsyncSessionLocal() as lookup_db:
+                existing_ids = await self._existing_post_ids(lookup_db, post_ids)
+        rows = await self._prepare_rows(all_posts, india_posts, existing_ids, stats)
 
-        try:
-            await db.commit()
-        except Exception as e:
-            await db.rollback()
-            logger.error(f"Commit failed: {e}")
+        # Phase 3: Save
+        if db is not None:
+            partitions = [rows]
+            outcomes = [await self._commit_rows(db, rows)]
+        else:
+            # One transaction per subreddit / RSS feed, overlapped via the pool
+            by_source: dict[str, list[dict]] = {}
+            for row in rows:
+                by_source.setdefault(row['subreddit'], []).append(row)
+            partitions = list(by_source.values())
+            outcomes = await asyncio.gather(
+                *[self._commit_rows_in_new_session(part) for part in partitions],
+                return_exceptions=True,
+            )
 
+        for part, inserted in zip(partitions, outcomes):
+            if isinstance(inserted, Exception):
+                logger.error(f"Saving batch failed: {inserted}")
+                inserted = None
+            if inserted is None:
+                stats['failed'] += len(part)
+            else:
+                stats['saved'] += inserted
+                # Rows that lost a race with a concurrent insert count as duplicates
+                stats['skip_reasons']['duplicate'] += len(part) - inserted
+                stats['skipped'] += len(part) - inserted
+
+        saved, skipped, failed = stats['saved'], stats['skipped'], stats['failed']
+        skip_reasons = stats['skip_reasons']
         total = saved + skipped + failed
         logger.info(f"Hype layer: {saved} saved, {skipped} skipped, {failed} failed (Reddit: {len(all_posts)}, India RSS: {len(india_posts)})")
 
@@ -119,52 +161,218 @@ class RedditService:
             'acceptance_rate': (saved / total * 100) if total > 0 else 0,
         }
 
-    async def _process_and_save(self, db: AsyncSession, post: dict, extract: bool, skip_reasons: dict) -> str:
-        """Process a single post and save to DB. Returns 'saved', 'skipped', or 'failed'."""
+    async def _prepare_rows(
+        self,
+        reddit_posts: list[dict],
+        india_posts: list[dict],
+        existing_ids: set[str],
+        stats: dict,
+    ) -> list[dict]:
+        """Filter out stored/repeated posts, enrich the rest and tally skips in stats.
+        Returns the column values of every post ready to insert.
+        """
+        skip_reasons = stats['skip_reasons']
+        rows: list[dict] = []
+
+        # Drop stored posts and in-batch repeats before the CPU-heavy enrichment
+        pending: list[tuple[dict, bool]] = []
+        for posts, extract in ((reddit_posts, True), (india_posts, False)):
+            for post in posts:
+                if post['post_id'] in existing_ids:
+                    skip_reasons['duplicate'] += 1
+                    stats['skipped'] += 1
+                    continue
+                existing_ids.add(post['post_id'])
+                pending.append((post, extract))
+
+        for status, value in await self._enrich(pending):
+            if status == 'queued':
+                rows.append(value)
+            elif status == 'skipped':
+                skip_reasons[value] += 1
+                stats['skipped'] += 1
+            else:
+                stats['failed'] += 1
+
+        return rows
+
+    async def _commit_rows_in_new_session(self, rows: list[dict]) -> Optional[int]:
+        """Run _commit_rows in a session of its own."""
+        async with AsyncSessionLocal() as db:
+            return await self._commit_rows(db, rows)
+
+    async def _commit_rows(self, db: AsyncSession, rows: list[dict]) -> Optional[int]:
+        """Insert rows and commit as one transaction.
+        Returns the number of rows inserted, or None if the transaction failed.
+        """
+        try:
+            inserted = await self._insert_posts(db, rows)
+            await db.commit()
+            return inserted
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Commit failed: {e}")
+            return None
+
+    async def _existing_post_ids(self, db: AsyncSession, post_ids: list[str]) -> set[str]:
+        """Return the subset of post_ids already stored in the DB."""
+        if not post_ids:
+            return set()
+        result = await db.execute(_EXISTING_POST_IDS, {'post_ids': post_ids})
+        return set(result.scalars().all())
+
+    @classmethod
+    def _get_process_pool(cls) -> ProcessPoolExecutor:
+        """Process pool shared by every RedditService in this process.
+
+        Workers are spawned, not forked: the parent has a running event loop
+        and live asyncpg/Redis connections that a forked child must not
+        inherit. They build the VADER analyzer on start-up rather than
+        inside their first chunk.
+        """
+        if cls._process_pool is None:
+            cls._process_pool = ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=get_sentiment_analyzer,
+            )
+        return cls._process_pool
+
+    @classmethod
+    def shutdown_process_pool(cls) -> None:
+        """Stop the shared process pool, if one was started (worker exit hook)."""
+        if cls._process_pool is not None:
+            cls._process_pool.shutdown(wait=True, cancel_futures=True)
+            cls._process_pool = None
+
+    async def _enrich(self, items: list[tuple[dict, bool]]) -> list[tuple[str, object]]:
+        """Run _enrich_posts off the event loop.
+
+        Small batches go to a thread; larger ones are split into
+        ENRICH_CHUNK_SIZE chunks and scored in parallel in the process pool.
+        Daemonic processes (Celery prefork workers) cannot have children,
+        so there every batch goes to a thread.
+        """
+        if len(items) <= ENRICH_CHUNK_SIZE or multiprocessing.current_process().daemon:
+            return await asyncio.to_thread(_enrich_posts, items, self.quality_scorer)
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_process_pool()
+        chunks = [items[i:i + ENRICH_CHUNK_SIZE] for i in range(0, len(items), ENRICH_CHUNK_SIZE)]
+        results = await asyncio.gather(*[
+            loop.run_in_executor(pool, _enrich_posts, chunk, self.quality_scorer)
+            for chunk in chunks
+        ])
+        return [outcome for chunk in results for outcome in chunk]
+
+    async def _insert_posts(self, db: AsyncSession, rows: list[dict]) -> int:
+        """Bulk insert rows, skipping post_ids that already exist. Returns rows inserted."""
+        if not rows:
+            return 0
+        result = await db.execute(_INSERT_POSTS, rows)
+        return len(result.scalars().all())
+
+    async def get_quality_analytics(self, db: AsyncSession, hours: int = 24, quality_threshold: Optional[int] = None) -> dict:
+        """Get quality analytics for posts within a time window."""
+        from datetime import timedelta
+        from sqlalchemy import func, case, tuple_
+
+        threshold = quality_threshold or self.min_quality
+        cutoff = __import__('datetime').datetime.now(__import__('datetime').timezone.utc) - timedelta(hours=hours)
+
+        # Overall aggregates (grand-total grouping set) and the tier histogram
+        # in one round-trip; grouping() tells the grand-total row apart from
+        # a tier that happens to be NULL
+        result = await db.execute(
+            select(
+                RedditPost.quality_tier,
+                func.grouping(RedditPost.quality_tier).label('is_total'),
+                func.count(RedditPost.id).label('total'),
+                func.avg(RedditPost.quality_score).label('avg_quality'),
+                func.sum(case((RedditPost.quality_score >= threshold, 1), else_=0)).label('high'),
+                func.sum(case((RedditPost.quality_score < threshold, 1), else_=0)).label('low'),
+            )
+            .where(RedditPost.created_at >= cutoff)
+            .group_by(func.grouping_sets(tuple_(), tuple_(RedditPost.quality_tier)))
+        )
+        row = None
+        dist = {}
+        for r in result.all():
+            if r.is_total:
+                row = r
+            else:
+                dist[r.quality_tier] = r.total
+        for t in ['poor', 'fair', 'good', 'excellent']:
+            dist.setdefault(t, 0)
+
+        total = row.total if row else 0
+        avg_quality = row.avg_quality if row else None
+        high = row.high if row else 0
+        low = row.low if row else 0
+
+        return {
+            'total': total,
+            'avg_quality': round(float(avg_quality or 0), 2),
+            'high_quality_pct': round((high or 0) / total * 100, 2) if total else 0,
+            'low_quality_pct': round((low or 0) / total * 100, 2) if total else 0,
+            'quality_distribution': dist,
+            'quality_threshold': threshold,
+            'time_window_hours': hours,
+        }
+
+
+def _enrich_posts(items: list[tuple[dict, bool]], quality_scorer: QualityScorer) -> list[tuple[str, object]]:
+    """Extract tickers, score quality and sentiment for (post, extract) pairs.
+    Returns ('queued', row), ('skipped', reason) or ('failed', None) per item.
+
+    Module-level so process pool workers can run it. Reddit posts that have
+    tickers are quality-scored together in one vectorized score_posts call;
+    sentiment, the costliest step, runs only for posts that pass (dedup
+    already happened in RedditService._prepare_rows).
+    """
+    outcomes: list[Optional[tuple[str, object]]] = [None] * len(items)
+    candidates: list[tuple[int, dict, list[str], Optional[float], Optional[str]]] = []
+
+    for i, (post, extract) in enumerate(items):
         try:
-            # Extract tickers + sentiment if not pre-computed (Reddit posts)
+            # Extract tickers if not pre-computed (Reddit posts)
             if extract:
                 text = f"{post['title']} {post.get('body', '')}"
                 tickers = extract_tickers(text)
-                if not tickers:
-                    skip_reasons['no_tickers'] += 1
-                    return 'skipped'
-                sentiment = analyze_sentiment(text)
+                sentiment = None
             else:
+                text = None
                 tickers = post.get('tickers', [])
                 sentiment = post.get('sentiment_score', 0.0)
-                if not tickers:
-                    skip_reasons['no_tickers'] += 1
-                    return 'skipped'
-
-            # Dedup
-            exists = (await db.execute(
-                select(RedditPost.id).where(RedditPost.post_id == post['post_id'])
-            )).first()
-            if exists:
-                skip_reasons['duplicate'] += 1
-                return 'skipped'
-
-            # Quality scoring — skip for RSS (professional news sources)
-            is_rss = post.get('subreddit', '').startswith('rss:')
-            if is_rss:
-                quality_score, quality_tier, is_quality = 75.0, 'good', True
+            if not tickers:
+                outcomes[i] = ('skipped', 'no_tickers')
+                continue
+            candidates.append((i, post, tickers, sentiment, text))
+        except Exception as e:
+            logger.error(f"Error processing post {post.get('post_id')}: {e}")
+            outcomes[i] = ('failed', None)
+
+    # Quality scoring — skip for RSS (professional news sources)
+    to_score = [c for c in candidates if not c[1].get('subreddit', '').startswith('rss:')]
+    quality = _score_quality([post for _, post, _, _, _ in to_score], quality_scorer)
+    quality_by_index = {c[0]: q for c, q in zip(to_score, quality)}
+
+    for i, post, tickers, sentiment, text in candidates:
+        try:
+            if i in quality_by_index:
+                q = quality_by_index[i]
+                if isinstance(q, Exception):
+                    raise q
+                quality_score, quality_tier, is_quality = q
+                if not is_quality:
+                    outcomes[i] = ('skipped', 'low_quality')
+                    continue
             else:
-                quality = self.quality_scorer.score_post(
-                    title=post['title'],
-                    body=post.get('body', ''),
-                    upvotes=post.get('score', 0),
-                    downvotes=int(post.get('score', 0) * (1 - post.get('upvote_ratio', 0.5))),
-                    comment_count=post.get('num_comments', 0),
-                    upvote_ratio=post.get('upvote_ratio', 0.5),
-                    created_at=post.get('created_at'),
-                )
-                if not quality.is_quality:
-                    skip_reasons['low_quality'] += 1
-                    return 'skipped'
-                quality_score, quality_tier, is_quality = quality.overall_score, quality.quality_tier, quality.is_quality
-
-            db.add(RedditPost(
+                quality_score, quality_tier, is_quality = 75.0, 'good', True
+
+            if sentiment is None:
+                sentiment = analyze_sentiment(text)
+
+            outcomes[i] = ('queued', dict(
                 post_id=post['post_id'],
                 subreddit=post.get('subreddit', ''),
                 title=post['title'],
@@ -183,46 +391,75 @@ class RedditService:
                 created_at=post.get('created_at'),
                 url=post.get('url', ''),
             ))
-            return 'saved'
-
         except Exception as e:
             logger.error(f"Error processing post {post.get('post_id')}: {e}")
-            return 'failed'
+            outcomes[i] = ('failed', None)
 
-    async def get_quality_analytics(self, db: AsyncSession, hours: int = 24, quality_threshold: Optional[int] = None) -> dict:
-        """Get quality analytics for posts within a time window."""
-        from datetime import timedelta
-        from sqlalchemy import func, case
+    return outcomes
 
-        threshold = quality_threshold or self.min_quality
-        cutoff = __import__('datetime').datetime.now(__import__('datetime').timezone.utc) - timedelta(hours=hours)
 
-        result = await db.execute(
-            select(
-                func.count(RedditPost.id).label('total'),
-                func.avg(RedditPost.quality_score).label('avg_quality'),
-                func.sum(case((RedditPost.quality_score >= threshold, 1), else_=0)).label('high'),
-                func.sum(case((RedditPost.quality_score < threshold, 1), else_=0)).label('low'),
-            ).where(RedditPost.created_at >= cutoff)
-        )
-        row = result.first()
-        total = row.total or 0
+def _score_quality(posts: list[dict], quality_scorer: QualityScorer) -> list:
+    """(overall_score, quality_tier, is_quality) per post, or the exception raised.
 
-        tier_result = await db.execute(
-            select(RedditPost.quality_tier, func.count(RedditPost.id))
-            .where(RedditPost.created_at >= cutoff)
-            .group_by(RedditPost.quality_tier)
-        )
-        dist = {tier: cnt for tier, cnt in tier_result.all()}
-        for t in ['poor', 'fair', 'good', 'excellent']:
-            dist.setdefault(t, 0)
+    Scores the whole batch with QualityScorer.score_posts; if the batch has
+    missing or malformed values it falls back to score_post per post so one
+    bad post cannot fail the rest.
+    """
+    if not posts:
+        return []
+    frame = _quality_frame(posts)
+    if frame is not None:
+        try:
+            scores = quality_scorer.score_posts(frame)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Batch quality scoring failed, scoring {len(posts)} posts one by one: {e!r}")
+        else:
+            return list(zip(
+                scores['overall_score'].tolist(),
+                scores['quality_tier'].tolist(),
+                scores['is_quality'].tolist(),
+            ))
 
-        return {
-            'total': total,
-            'avg_quality': round(float(row.avg_quality or 0), 2),
-            'high_quality_pct': round((row.high or 0) / total * 100, 2) if total else 0,
-            'low_quality_pct': round((row.low or 0) / total * 100, 2) if total else 0,
-            'quality_distribution': dist,
-            'quality_threshold': threshold,
-            'time_window_hours': hours,
-        }
+    results = []
+    for post in posts:
+        try:
+            q = quality_scorer.score_post(
+                title=post['title'],
+                body=post.get('body', ''),
+                upvotes=post.get('score', 0),
+                downvotes=_estimate_downvotes(post.get('score', 0), post.get('upvote_ratio', 0.5)),
+                comment_count=post.get('num_comments', 0),
+                upvote_ratio=post.get('upvote_ratio', 0.5),
+                created_at=post.get('created_at'),
+            )
+            results.append((q.overall_score, q.quality_tier, q.is_quality))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _quality_frame(posts: list[dict]) -> Optional[pd.DataFrame]:
+    """score_posts input for the batch, or None if any engagement value is missing or non-numeric."""
+    try:
+        frame = pd.DataFrame({
+            'title': [p['title'] for p in posts],
+            'body': [p.get('body', '') for p in posts],
+            'upvotes': [p.get('score', 0) for p in posts],
+            'comment_count': [p.get('num_comments', 0) for p in posts],
+            'upvote_ratio': [p.get('upvote_ratio', 0.5) for p in posts],
+        })
+        numeric = frame[['upvotes', 'comment_count', 'upvote_ratio']].astype('float64')
+    except (KeyError, TypeError, ValueError):
+        return None
+    if numeric.isna().to_numpy().any():
+        return None
+    return frame
+
+
+def _estimate_downvotes(score: int, upvote_ratio: float) -> int:
+    """Approximate downvotes from a post's net score and upvote ratio.
+
+    Clamped at zero: int(score * (1 - ratio)) went negative for posts with
+    a negative score.
+    """
+    return max(0, round(score * (1 - upvote_ratio)))
@@ -1,15 +1,59 @@
 import asyncio
+import time
+from collections import OrderedDict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from backend.cache.redis_client import CacheKeys, get_redis
+from backend.database.config import AsyncSessionLocal
 from backend.models.stock import StockPrice
 from backend.scrapers.stock_scraper import StockScraper
 from backend.utils.logger import logger
 from datetime import datetime
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
+
+_EXISTING_PRICE_DATES = select(StockPrice.date).where(
+    StockPrice.ticker == bindparam('ticker'),
+    StockPrice.date.between(bindparam('start'), bindparam('end')),
+)
+_INSERT_PRICES = (
+    pg_insert(StockPrice.__table__)
+    .on_conflict_do_nothing(index_elements=['ticker', 'date'])
+    .returning(StockPrice.__table__.c.id)
+)
+_LATEST_PRICE = (
+    select(StockPrice)
+    .where(StockPrice.ticker == bindparam('ticker'))
+    .order_by(StockPrice.date.desc())
+    .limit(1)
+)
+# Newest close per ticker in one round trip (DISTINCT ON keeps the first
+# row of each ticker group, i.e. the latest date)
+_LATEST_CLOSES = (
+    select(StockPrice.ticker, StockPrice.close)
+    .where(StockPrice.ticker.in_(bindparam('tickers', expanding=True)))
+    .order_by(StockPrice.ticker, StockPrice.date.desc())
+    .distinct(StockPrice.ticker)
+)
+
 
 class StockService:
     """Service layer for stock price data management"""
     
+    # Process-local TTL cache for get_latest_price / get_momentum_signals,
+    # sitting in front of the DB (the API routes add Redis as a shared layer).
+    # Keyed like Redis and cleared for a ticker whenever new prices are saved.
+    # Every entry gets the same TTL, so insertion order is expiry order:
+    # writes drop expired entries from the front and evict the oldest once
+    # LOCAL_CACHE_MAX_ENTRIES is reached.
+    LOCAL_CACHE_SECONDS = 30
+    LOCAL_CACHE_MAX_ENTRIES = 1024
+    _local_cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+    
+    # Per-ticker sessions open at once in fetch_and_save_multiple; keeps a
+    # large watchlist from draining the engine pool (10 + 20 overflow)
+    MAX_CONCURRENT_SAVES = 8
+    
     def __init__(self):
         self.scraper = StockScraper()
     
@@ -39,33 +83,9 @@ class StockService:
             logger.warning(f"No data fetched for {ticker}")
             return {"ticker": ticker, "saved": 0, "skipped": 0, "errors": 1}
         
-        saved_count = 0
-        skipped_count = 0
-        
-        for price_data in prices:
-            try:
-                # Check if record already exists
-                existing = await db.execute(
-                    select(StockPrice).where(
-                        StockPrice.ticker == price_data['ticker'],
-                        StockPrice.date == price_data['date']
-                    )
-                )
-                if existing.scalar_one_or_none():
-                    skipped_count += 1
-                    continue
-                
-                # Create new stock price record
-                stock_price = StockPrice(**price_data)
-                db.add(stock_price)
-                saved_count += 1
-                
-            except Exception as e:
-                logger.error(f"Error saving {ticker} record: {e}")
-                continue
-        
-        # Commit all records
+        # Add new records and commit
         try:
+            saved_count, skipped_count = await self._insert_new_prices(db, prices)
             await db.commit()
             logger.info(f"{ticker}: Saved {saved_count}, Skipped {skipped_count}")
         except Exception as e:
@@ -73,6 +93,9 @@ class StockService:
             logger.error(f"Failed to commit {ticker} data: {e}")
             return {"ticker": ticker, "saved": 0, "skipped": 0, "errors": 1}
         
+        if saved_count:
+            await self._invalidate_cache(ticker)
+        
         return {
             "ticker": ticker,
             "saved": saved_count,
@@ -83,7 +106,7 @@ class StockService:
     async def fetch_and_save_multiple(
         self,
         tickers: List[str],
-        db: AsyncSession,
+        db: Optional[AsyncSession] = None,
         period: str = "3mo"
     ) -> Dict[str, Dict]:
         """
@@ -91,7 +114,9 @@ class StockService:
         
         Args:
             tickers: List of stock symbols
-            db: Database session
+            db: Database session. If None, each ticker is saved in its own
+                AsyncSessionLocal() session and the saves run concurrently,
+                at most MAX_CONCURRENT_SAVES at a time.
             period: Historical period
             
         Returns:
@@ -99,61 +124,99 @@ class StockService:
             
         Hybrid Approach:
         Phase 1: Fetch all tickers in parallel (fast network I/O)
-        Phase 2: Save to DB sequentially (safe transactions)
+        Phase 2: Save to DB, one transaction per ticker (sequential on a
+                 shared session, concurrent with per-ticker sessions)
         """
         logger.info(f"Fetching {len(tickers)} tickers in parallel...")
         
         # ⚡ PHASE 1: PARALLEL FETCH (fast)
         all_data = await self.scraper.fetch_multiple(tickers, period)
         
-        # 🔒 PHASE 2: SEQUENTIAL SAVE (safe)
+        # 🔒 PHASE 2: SAVE (one transaction per ticker)
+        if db is not None:
+            results = {}
+            for ticker in tickers:
+                results[ticker] = await self._save_ticker(db, ticker, all_data.get(ticker, []))
+            return results
+        
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SAVES)
+        outcomes = await asyncio.gather(
+            *[self._save_ticker_in_new_session(t, all_data.get(t, []), semaphore) for t in tickers],
+            return_exceptions=True
+        )
         results = {}
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Failed to save %s: %s", ticker, outcome)
+                outcome = {"saved": 0, "skipped": 0, "errors": 1}
+            results[ticker] = outcome
+        return results
+    
+    async def _save_ticker_in_new_session(
+        self,
+        ticker: str,
+        prices: List[Dict],
+        semaphore: asyncio.Semaphore
+    ) -> Dict:
+        """Run _save_ticker in a session of its own, once semaphore allows."""
+        async with semaphore, AsyncSessionLocal() as db:
+            return await self._save_ticker(db, ticker, prices)
+    
+    async def _save_ticker(self, db: AsyncSession, ticker: str, prices: List[Dict]) -> Dict:
+        """Insert one ticker's prices and commit (transaction boundary)."""
+        if not prices:
+            logger.warning("No data fetched for %s", ticker)
+            return {"saved": 0, "skipped": 0, "errors": 1}
         
-        for ticker in tickers:
-            prices = all_data.get(ticker, [])
-            
-            if not prices:
-                logger.warning(f"No data fetched for {ticker}")
-                results[ticker] = {"saved": 0, "skipped": 0, "errors": 1}
+        try:
+            saved_count, skipped_count = await self._insert_new_prices(db, prices)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error("Failed to save %s: %s", ticker, e)
+            return {"saved": 0, "skipped": 0, "errors": 1}
+        
+        logger.info("%s: Saved %d, Skipped %d", ticker, saved_count, skipped_count)
+        if saved_count:
+            await self._invalidate_cache(ticker)
+        return {
+            "saved": saved_count,
+            "skipped": skipped_count,
+            "errors": 0
+        }
+    
+    async def _insert_new_prices(self, db: AsyncSession, prices: List[Dict]) -> tuple[int, int]:
+        """
+        Bulk insert price records not yet stored (no commit).
+        
+        prices all belong to one ticker. Stored dates in their range are
+        fetched with a single range query (an index scan on ticker, date)
+        and the remainder go out as one INSERT ... ON CONFLICT DO NOTHING,
+        so a concurrent writer cannot trip the unique constraint.
+        
+        Returns:
+            (saved, skipped) counts
+        """
+        dates = [p['date'] for p in prices]
+        result = await db.execute(
+            _EXISTING_PRICE_DATES,
+            {'ticker': prices[0]['ticker'], 'start': min(dates), 'end': max(dates)}
+        )
+        have = set(result.scalars().all())
+        
+        new_rows = []
+        for date, price_data in zip(dates, prices):
+            if date in have:
                 continue
-            
-            saved_count = 0
-            skipped_count = 0
-            
-            try:
-                for price_data in prices:
-                    # Check if record already exists
-                    existing = await db.execute(
-                        select(StockPrice).where(
-                            StockPrice.ticker == price_data['ticker'],
-                            StockPrice.date == price_data['date']
-                        )
-                    )
-                    if existing.scalar_one_or_none():
-                        skipped_count += 1
-                        continue
-                    
-                    # Add to session
-                    stock_price = StockPrice(**price_data)
-                    db.add(stock_price)
-                    saved_count += 1
-                
-                # Commit per ticker (transaction boundary)
-                await db.commit()
-                logger.info(f"{ticker}: Saved {saved_count}, Skipped {skipped_count}")
-                
-                results[ticker] = {
-                    "saved": saved_count,
-                    "skipped": skipped_count,
-                    "errors": 0
-                }
-                
-            except Exception as e:
-                await db.rollback()
-                logger.error(f"Failed to save {ticker}: {e}")
-                results[ticker] = {"saved": 0, "skipped": 0, "errors": 1}
+            new_rows.append(price_data)
+            have.add(date)
         
-        return results
+        saved_count = 0
+        if new_rows:
+            result = await db.execute(_INSERT_PRICES, new_rows)
+            saved_count = len(result.scalars().all())
+        
+        return saved_count, len(prices) - saved_count
     
     async def get_latest_price(
         self,
@@ -161,14 +224,65 @@ class StockService:
         db: AsyncSession
     ) -> float | None:
         """Get most recent price from database"""
-        result = await db.execute(
-            select(StockPrice)
-            .where(StockPrice.ticker == ticker.upper())
-            .order_by(StockPrice.date.desc())
-            .limit(1)
-        )
+        key = CacheKeys.stock_price(ticker)
+        cached = self._local_get(key)
+        if cached is not None:
+            return cached
+        
+        result = await db.execute(_LATEST_PRICE, {'ticker': ticker.upper()})
         latest = result.scalar_one_or_none()
-        return latest.close if latest else None
+        if not latest:
+            return None
+        self._local_set(key, latest.close)
+        return latest.close
+    
+    async def get_latest_prices(
+        self,
+        tickers: List[str],
+        db: AsyncSession
+    ) -> Dict[str, float]:
+        """
+        Get most recent prices for several tickers from database.
+        
+        Lookup order is the local TTL cache, then Redis (one MGET), then a
+        single DB query for whatever is still missing; DB results are
+        written back to both caches.
+        
+        Returns:
+            Dict mapping ticker (upper-cased) to its latest close; tickers
+            with no stored prices are omitted.
+        """
+        prices: Dict[str, float] = {}
+        missing: List[str] = []
+        for ticker in {t.upper() for t in tickers}:
+            cached = self._local_get(CacheKeys.stock_price(ticker))
+            if cached is not None:
+                prices[ticker] = cached
+            else:
+                missing.append(ticker)
+        
+        if missing:
+            cache = await get_redis()
+            cached_prices = await cache.get_stock_prices(missing)
+            for ticker, close in cached_prices.items():
+                self._local_set(CacheKeys.stock_price(ticker), close)
+            prices.update(cached_prices)
+            missing = [t for t in missing if t not in cached_prices]
+            logger.debug(
+                "Latest prices: %d local, %d redis, %d db",
+                len(prices) - len(cached_prices), len(cached_prices), len(missing)
+            )
+        
+        if missing:
+            result = await db.execute(_LATEST_CLOSES, {'tickers': missing})
+            for ticker, close in result.all():
+                if close is None:
+                    continue
+                self._local_set(CacheKeys.stock_price(ticker), close)
+                await cache.set_stock_price(ticker, close)
+                prices[ticker] = close
+        
+        return prices
     
     async def get_momentum_signals(
         self,
@@ -181,12 +295,12 @@ class StockService:
         Returns:
             Dictionary with RSI, MACD, SMA crossover status, etc.
         """
-        result = await db.execute(
-            select(StockPrice)
-            .where(StockPrice.ticker == ticker.upper())
-            .order_by(StockPrice.date.desc())
-            .limit(1)
-        )
+        key = CacheKeys.stock_signals(ticker)
+        cached = self._local_get(key)
+        if cached is not None:
+            return cached
+        
+        result = await db.execute(_LATEST_PRICE, {'ticker': ticker.upper()})
         latest = result.scalar_one_or_none()
         
         if not latest:
@@ -197,7 +311,7 @@ class StockService:
         if latest.sma_50 and latest.sma_200:
             sma_crossover = "bullish" if latest.sma_50 > latest.sma_200 else "bearish"
         
-        return {
+        signals = {
             "ticker": ticker.upper(),
             "date": latest.date,
             "close": latest.close,
@@ -211,17 +325,57 @@ class StockService:
             "volume_ratio": latest.volume_ratio,
             "bb_position": self._calculate_bb_position(latest)
         }
+        self._local_set(key, signals)
+        return signals
     
     def _calculate_bb_position(self, stock_price: StockPrice) -> str | None:
         """Calculate where price is relative to Bollinger Bands"""
-        if not (stock_price.bb_upper and stock_price.bb_lower):
+        return bb_position(stock_price.close, stock_price.bb_upper, stock_price.bb_lower)
+    
+    @classmethod
+    def _local_get(cls, key: str) -> Any:
+        """Return an unexpired local cache entry (dicts as a copy), or None."""
+        entry = cls._local_cache.get(key)
+        if entry is None:
             return None
-        
-        close = stock_price.close
-        
-        if close > stock_price.bb_upper:
-            return "above_upper"
-        elif close < stock_price.bb_lower:
-            return "below_lower"
-        else:
-            return "inside_bands"
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            cls._local_cache.pop(key, None)
+            return None
+        # Callers may mutate what they get back; keep the cached dict private
+        return value.copy() if isinstance(value, dict) else value
+    
+    @classmethod
+    def _local_set(cls, key: str, value: Any) -> None:
+        """Cache a copy of value, pruning expired and excess entries."""
+        now = time.monotonic()
+        cache = cls._local_cache
+        cache.pop(key, None)
+        # Oldest entries expire first, so stop at the first live one
+        while cache and next(iter(cache.values()))[0] <= now:
+            cache.popitem(last=False)
+        while len(cache) >= cls.LOCAL_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        cache[key] = (now + cls.LOCAL_CACHE_SECONDS, value.copy() if isinstance(value, dict) else value)
+    
+    async def _invalidate_cache(self, ticker: str) -> None:
+        """Drop cached latest price / signals for ticker, locally and in Redis."""
+        keys = (CacheKeys.stock_price(ticker), CacheKeys.stock_signals(ticker))
+        for key in keys:
+            self._local_cache.pop(key, None)
+        cache = await get_redis()
+        for key in keys:
+            await cache.delete(key)
+
+
+def bb_position(close: float, bb_upper: float | None, bb_lower: float | None) -> str | None:
+    """Where close sits relative to the Bollinger Bands (pure, picklable)."""
+    if not (bb_upper and bb_lower):
+        return None
+    
+    if close > bb_upper:
+        return "above_upper"
+    elif close < bb_lower:
+        return "below_lower"
+    else:
+        return "inside_bands"
@@ -35,7 +35,8 @@ from backend.strategy.regime_filter import RegimeFilter
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_WATCHLIST = [
+# Tuple so callers that default to it can't mutate the shared watchlist
+DEFAULT_WATCHLIST = (
     # US (NYSE/NASDAQ)
     "AAPL", "MSFT", "GOOGL", "AMZN", "TSLA",
     "NVDA", "META", "AMD", "NFLX", "DIS",
@@ -45,7 +46,7 @@ DEFAULT_WATCHLIST = [
     "RELIANCE.NS", "TCS.NS", "HDFCBANK.NS", "INFY.NS", "ICICIBANK.NS",
     "SBIN.NS", "BHARTIARTL.NS", "KOTAKBANK.NS", "LT.NS", "AXISBANK.NS",
     "TATAMOTORS.NS", "TATASTEEL.NS", "BAJFINANCE.NS", "TITAN.NS", "ITC.NS",
-]
+)
 
 DEFAULT_PORTFOLIO_VALUE = 100_000.0
 
@@ -1,9 +1,8 @@
 """Celery tasks for insider trade ingestion."""
 
-import asyncio
 import logging
 
-from backend.celery_app import app
+from backend.celery_app import app, run_async
 from backend.database.config import AsyncSessionLocal
 from backend.strategy.insider_tracker import InsiderTracker
 from backend.models.insider_trade import InsiderTrade
@@ -58,4 +57,4 @@ def ingest_insider_trades(self, days_back: int = 7):
         logger.info(f"Insider ingestion complete: {inserted} inserted, {skipped} skipped (dupes)")
         return {"inserted": inserted, "skipped": skipped}
 
-    return asyncio.run(_ingest())
+    return run_async(_ingest())
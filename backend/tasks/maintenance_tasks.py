@@ -9,10 +9,39 @@ These tasks run on schedule to:
 import asyncio
 from datetime import datetime, timedelta, timezone
 from celery import shared_task
-from sqlalchemy import delete, select, func
+from sqlalchemy import delete, select, func, text
+from backend.celery_app import run_async
 from backend.database.config import AsyncSessionLocal
 from backend.utils.logger import logger
 
+# Rows removed per DELETE/commit in cleanup_old_data
+CLEANUP_BATCH_SIZE = 10_000
+
+
+async def _delete_in_chunks(db, model, *conditions) -> int:
+    """
+    Delete rows of model matching conditions, CLEANUP_BATCH_SIZE at a time.
+    
+    Each chunk is committed on its own so locks and WAL stay bounded and a
+    retried task resumes where the previous attempt stopped.
+    
+    Returns:
+        Total rows deleted
+    """
+    deleted = 0
+    while True:
+        result = await db.execute(
+            delete(model)
+            .where(model.id.in_(
+                select(model.id).where(*conditions).limit(CLEANUP_BATCH_SIZE)
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < CLEANUP_BATCH_SIZE:
+            return deleted
+
 
 @shared_task(
     name="backend.tasks.maintenance_tasks.cleanup_old_data",
@@ -53,27 +82,21 @@ def cleanup_old_data(self, retention_days: int = 90):
         async with AsyncSessionLocal() as db:
             try:
                 # Delete old Reddit posts
-                result = await db.execute(
-                    delete(RedditPost).where(RedditPost.created_at < cutoff)
+                results["posts_deleted"] = await _delete_in_chunks(
+                    db, RedditPost, RedditPost.created_at < cutoff
                 )
-                results["posts_deleted"] = result.rowcount
                 
                 # Delete old stock prices
-                result = await db.execute(
-                    delete(StockPrice).where(StockPrice.date < cutoff)
+                results["prices_deleted"] = await _delete_in_chunks(
+                    db, StockPrice, StockPrice.date < cutoff
                 )
-                results["prices_deleted"] = result.rowcount
                 
                 # Delete old closed signals (keep active ones)
-                result = await db.execute(
-                    delete(TradingSignal).where(
-                        TradingSignal.generated_at < cutoff,
-                        TradingSignal.is_active == 0,
-                    )
+                results["signals_deleted"] = await _delete_in_chunks(
+                    db, TradingSignal,
+                    TradingSignal.generated_at < cutoff,
+                    TradingSignal.is_active == 0,
                 )
-                results["signals_deleted"] = result.rowcount
-                
-                await db.commit()
                 
                 logger.info(
                     f"🧹 Cleanup completed: {results['posts_deleted']} posts, "
@@ -88,7 +111,7 @@ def cleanup_old_data(self, retention_days: int = 90):
         return results
     
     try:
-        return asyncio.run(_cleanup())
+        return run_async(_cleanup())
     except Exception as e:
         logger.error(f"Maintenance task failed: {e}")
         raise self.retry(exc=e)
@@ -98,7 +121,7 @@ def cleanup_old_data(self, retention_days: int = 90):
     name="backend.tasks.maintenance_tasks.generate_system_report",
     bind=True,
 )
-def generate_system_report(self):
+def generate_system_report(self, precise: bool = False):
     """
     Generate daily system health report.
     
@@ -110,6 +133,11 @@ def generate_system_report(self):
     
     Run: Daily at 6 AM UTC
     
+    Args:
+        precise: Exact COUNT(*) per table instead of the planner's
+            pg_class.reltuples estimate (a full scan vs. a catalog lookup;
+            estimates are within a few percent after ANALYZE)
+    
     Returns:
         Dict with system metrics
     """
@@ -124,52 +152,62 @@ def generate_system_report(self):
             "data_freshness": {},
         }
         
-        async with AsyncSessionLocal() as db:
-            # Database counts
-            report["database"]["reddit_posts"] = (
-                await db.execute(select(func.count()).select_from(RedditPost))
-            ).scalar_one()
-            
-            report["database"]["stock_prices"] = (
-                await db.execute(select(func.count()).select_from(StockPrice))
-            ).scalar_one()
-            
-            report["database"]["trading_signals"] = (
-                await db.execute(select(func.count()).select_from(TradingSignal))
-            ).scalar_one()
-            
-            # Data freshness (most recent record)
-            latest_post = (
-                await db.execute(
-                    select(func.max(RedditPost.created_at))
-                )
-            ).scalar_one()
-            
-            latest_price = (
-                await db.execute(
-                    select(func.max(StockPrice.date))
-                )
-            ).scalar_one()
-            
-            now = datetime.now(timezone.utc)
-            
-            if latest_post:
-                # Handle timezone-naive datetime from DB
-                if latest_post.tzinfo is None:
-                    latest_post = latest_post.replace(tzinfo=timezone.utc)
-                hours_since_post = (now - latest_post).total_seconds() / 3600
-                report["data_freshness"]["reddit_hours_ago"] = round(hours_since_post, 2)
+        async def _scalar(stmt):
+            # Own session per query so the independent queries run concurrently
+            async with AsyncSessionLocal() as db:
+                return (await db.execute(stmt)).scalar_one()
+        
+        models = (RedditPost, StockPrice, TradingSignal)
+        
+        async def _counts():
+            estimates = {}
+            if not precise:
+                async with AsyncSessionLocal() as db:
+                    rows = await db.execute(
+                        text("""
+                            SELECT relname, reltuples::bigint AS est
+                            FROM pg_class
+                            WHERE relname = ANY(:names) AND relkind = 'r'
+                        """),
+                        {"names": [m.__tablename__ for m in models]},
+                    )
+                    # reltuples is -1 until the table is first analyzed
+                    estimates = {row.relname: row.est for row in rows if row.est >= 0}
             
-            if latest_price:
-                if latest_price.tzinfo is None:
-                    latest_price = latest_price.replace(tzinfo=timezone.utc)
-                hours_since_price = (now - latest_price).total_seconds() / 3600
-                report["data_freshness"]["stocks_hours_ago"] = round(hours_since_price, 2)
+            missing = [m for m in models if m.__tablename__ not in estimates]
+            exact = await asyncio.gather(
+                *[_scalar(select(func.count()).select_from(m)) for m in missing]
+            )
+            estimates.update(zip((m.__tablename__ for m in missing), exact))
+            return {m.__tablename__: estimates[m.__tablename__] for m in models}
+        
+        # Database counts and data freshness (most recent record)
+        report["database"], latest_post, latest_price = await asyncio.gather(
+            _counts(),
+            _scalar(select(func.max(RedditPost.created_at))),
+            _scalar(select(func.max(StockPrice.date))),
+        )
+        report["counts_estimated"] = not precise
+        
+        now = datetime.now(timezone.utc)
+        
+        if latest_post:
+            # Handle timezone-naive datetime from DB
+            if latest_post.tzinfo is None:
+                latest_post = latest_post.replace(tzinfo=timezone.utc)
+            hours_since_post = (now - latest_post).total_seconds() / 3600
+            report["data_freshness"]["reddit_hours_ago"] = round(hours_since_post, 2)
+        
+        if latest_price:
+            if latest_price.tzinfo is None:
+                latest_price = latest_price.replace(tzinfo=timezone.utc)
+            hours_since_price = (now - latest_price).total_seconds() / 3600
+            report["data_freshness"]["stocks_hours_ago"] = round(hours_since_price, 2)
         
         logger.info(f"📊 System report: {report['database']}")
         return report
     
-    return asyncio.run(_report())
+    return run_async(_report())
 
 
 @shared_task(
@@ -189,10 +227,7 @@ def refresh_trending_cache(self):
         Dict with cache refresh status
     """
     async def _refresh():
-        from backend.models.reddit import RedditPost
         from backend.cache.redis_client import get_redis, CacheKeys
-        from sqlalchemy import func
-        from collections import Counter
         
         result = {
             "refreshed_at": datetime.now(timezone.utc).isoformat(),
@@ -204,23 +239,21 @@ def refresh_trending_cache(self):
             # Get posts from last 7 days
             cutoff = datetime.now(timezone.utc) - timedelta(days=7)
             
-            posts = (
-                await db.execute(
-                    select(RedditPost.tickers)
-                    .where(RedditPost.created_at >= cutoff)
-                )
-            ).scalars().all()
-            
-            # Count ticker mentions
-            ticker_counts = Counter()
-            for tickers in posts:
-                if tickers:
-                    ticker_counts.update(tickers)
-            
-            # Get top 20
+            # Count ticker mentions and take the top 20 in Postgres
+            rows = await db.execute(
+                text("""
+                    SELECT ticker, COUNT(*) AS mentions
+                    FROM reddit_posts, unnest(tickers) AS ticker
+                    WHERE created_at >= :cutoff
+                    GROUP BY ticker
+                    ORDER BY mentions DESC
+                    LIMIT 20
+                """),
+                {"cutoff": cutoff},
+            )
             trending = [
-                {"ticker": ticker, "mentions": count}
-                for ticker, count in ticker_counts.most_common(20)
+                {"ticker": row.ticker, "mentions": row.mentions}
+                for row in rows
             ]
             
             # Cache it
@@ -235,4 +268,4 @@ def refresh_trending_cache(self):
         
         return result
     
-    return asyncio.run(_refresh())
+    return run_async(_refresh())
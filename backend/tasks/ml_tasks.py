@@ -1,5 +1,5 @@
 """Background ML tasks for signal generation and monitoring."""
-from backend.celery_app import app
+from backend.celery_app import app, run_async
 from backend.database.config import AsyncSessionLocal
 from backend.utils.logger import logger
 
@@ -10,8 +10,6 @@ def generate_daily_signals(self):
 
     Runs daily at 5:30 PM ET (after insider ingestion at 5:00 PM ET).
     """
-    import asyncio
-
     async def _generate():
         from backend.strategy.signal_engine import SignalEngine
 
@@ -31,7 +29,7 @@ def generate_daily_signals(self):
 
         return {"status": "success", "signals": len(signals)}
 
-    return asyncio.run(_generate())
+    return run_async(_generate())
 
 
 @app.task(name="backend.tasks.ml_tasks.monitor_active_signals", bind=True)
@@ -45,7 +43,6 @@ def monitor_active_signals(self):
     - If stop loss hit -> Mark as closed with 'stop_loss' reason
     - If signal expired -> Mark as closed with 'expired' reason
     """
-    import asyncio
     from datetime import datetime, timezone
     from sqlalchemy import select, update
     from backend.models.trading_signal import TradingSignal
@@ -54,25 +51,37 @@ def monitor_active_signals(self):
     async def _monitor():
         async with AsyncSessionLocal() as session:
             try:
-                # Get all active signals
+                # Get all active signals (only the columns the exit checks use)
                 result = await session.execute(
-                    select(TradingSignal).where(TradingSignal.is_active == 1)
+                    select(
+                        TradingSignal.id,
+                        TradingSignal.ticker,
+                        TradingSignal.target_price,
+                        TradingSignal.stop_loss,
+                        TradingSignal.expires_at,
+                    ).where(TradingSignal.is_active == 1)
                 )
-                signals = result.scalars().all()
+                signals = result.all()
                 
                 if not signals:
                     logger.info("No active signals to monitor")
                     return {"monitored": 0, "closed": 0}
                 
                 stock_service = StockService()
-                closed_count = 0
+                closes = []
+                now = datetime.now(timezone.utc)
+                
+                # Fetch current prices for every ticker in one query
+                prices = await stock_service.get_latest_prices(
+                    [signal.ticker for signal in signals], session
+                )
+                # Reads are done; don't keep the transaction open while
+                # evaluating exits
+                await session.commit()
                 
                 for signal in signals:
                     try:
-                        # Get current price
-                        current_price = await stock_service.get_latest_price(
-                            signal.ticker, session
-                        )
+                        current_price = prices.get(signal.ticker.upper())
                         
                         if current_price is None:
                             continue
@@ -88,36 +97,43 @@ def monitor_active_signals(self):
                             exit_reason = "stop_loss"
                         
                         # Check expiration
-                        elif signal.expires_at and datetime.now(timezone.utc) >= signal.expires_at:
+                        elif signal.expires_at and now >= signal.expires_at:
                             exit_reason = "expired"
                         
                         # Close signal if exit condition met
                         if exit_reason:
-                            await session.execute(
-                                update(TradingSignal)
-                                .where(TradingSignal.id == signal.id)
-                                .values(
-                                    is_active=0,
-                                    exit_price=current_price,
-                                    exit_reason=exit_reason,
-                                    closed_at=datetime.now(timezone.utc)
-                                )
-                            )
-                            closed_count += 1
+                            closes.append({
+                                "id": signal.id,
+                                "is_active": 0,
+                                "exit_price": current_price,
+                                "exit_reason": exit_reason,
+                                "closed_at": now,
+                            })
                             logger.info(
-                                f"Closed signal {signal.id} for {signal.ticker}: "
-                                f"{exit_reason} at ${current_price:.2f}"
+                                "Closed signal %s for %s: %s at $%.2f",
+                                signal.id, signal.ticker, exit_reason, current_price
                             )
                     
                     except Exception as e:
-                        logger.error(f"Error monitoring signal {signal.id}: {e}")
+                        logger.error("Error monitoring signal %s: %s", signal.id, e)
                         continue
                 
-                await session.commit()
+                # One executemany UPDATE by primary key for every closed signal,
+                # in its own short transaction. The is_active guard skips
+                # signals closed elsewhere since they were read; no ORM
+                # instances are loaded, so there is nothing to synchronize.
+                if closes:
+                    async with session.begin():
+                        await session.execute(
+                            update(TradingSignal)
+                            .where(TradingSignal.is_active == 1)
+                            .execution_options(synchronize_session=None),
+                            closes
+                        )
                 
                 return {
                     "monitored": len(signals),
-                    "closed": closed_count
+                    "closed": len(closes)
                 }
             
             except Exception as e:
@@ -125,7 +141,7 @@ def monitor_active_signals(self):
                 raise
     
     try:
-        result = asyncio.run(_monitor())
+        result = run_async(_monitor())
         return {
             "status": "success",
             "task_id": self.request.id,
@@ -1,5 +1,6 @@
 """Background scraping tasks for stock and Reddit data."""
-from backend.celery_app import app
+from backend.cache.redis_client import get_redis
+from backend.celery_app import app, run_async
 from backend.database.config import AsyncSessionLocal
 from backend.services.stock_service import StockService
 from backend.services.reddit_service import RedditService
@@ -13,21 +14,19 @@ def scrape_reddit_scheduled(self):
     Scheduled task to scrape Reddit posts from multiple subreddits.
     Runs every 30 minutes during market hours.
     """
-    import asyncio
-    
     async def _scrape():
-        async with AsyncSessionLocal() as session:
-            service = RedditService()
-            try:
-                stats = await service.scrape_and_save(session)
-                logger.info(f"Reddit scraping completed: {stats}")
-                return stats
-            except Exception as e:
-                logger.error(f"Reddit scraping failed: {e}")
-                raise
+        # The service opens one session per subreddit and saves them concurrently
+        service = RedditService()
+        try:
+            stats = await service.scrape_and_save()
+            logger.info(f"Reddit scraping completed: {stats}")
+            return stats
+        except Exception as e:
+            logger.error(f"Reddit scraping failed: {e}")
+            raise
     
     try:
-        result = asyncio.run(_scrape())
+        result = run_async(_scrape())
         return {
             "status": "success",
             "task_id": self.request.id,
@@ -49,40 +48,35 @@ def fetch_stocks_scheduled(self, tickers: List[str] = None):
     Runs every hour during market hours.
     
     Args:
-        tickers: List of stock symbols. If None, uses default watchlist.
+        tickers: List of stock symbols. If None, uses the default watchlist
+            plus the currently trending tickers.
     """
-    import asyncio
-    
-    # Default watchlist (top 20 trending stocks)
-    if tickers is None:
-        from backend.strategy.signal_engine import DEFAULT_WATCHLIST
-        tickers = DEFAULT_WATCHLIST
-    
     async def _fetch():
-        async with AsyncSessionLocal() as session:
-            service = StockService()
-            try:
-                results = await service.fetch_and_save_multiple(
-                    tickers=tickers,
-                    db=session,
-                    period="1d"  # Fetch latest day only for scheduled updates
-                )
-                
-                success_count = sum(1 for r in results.values() if r['errors'] == 0)
-                logger.info(f"Stock fetching completed: {success_count}/{len(tickers)} successful")
-                
-                return {
-                    "total": len(tickers),
-                    "successful": success_count,
-                    "failed": len(tickers) - success_count,
-                    "results": results
-                }
-            except Exception as e:
-                logger.error(f"Stock fetching failed: {e}")
-                raise
+        watchlist = tickers if tickers is not None else await _scheduled_watchlist()
+        
+        # The service opens one session per ticker and saves them concurrently
+        service = StockService()
+        try:
+            results = await service.fetch_and_save_multiple(
+                tickers=watchlist,
+                period="1d"  # Fetch latest day only for scheduled updates
+            )
+            
+            success_count = sum(1 for r in results.values() if r['errors'] == 0)
+            logger.info(f"Stock fetching completed: {success_count}/{len(watchlist)} successful")
+            
+            return {
+                "total": len(watchlist),
+                "successful": success_count,
+                "failed": len(watchlist) - success_count,
+                "results": results
+            }
+        except Exception as e:
+            logger.error(f"Stock fetching failed: {e}")
+            raise
     
     try:
-        result = asyncio.run(_fetch())
+        result = run_async(_fetch())
         return {
             "status": "success",
             "task_id": self.request.id,
@@ -97,6 +91,34 @@ def fetch_stocks_scheduled(self, tickers: List[str] = None):
         }
 
 
+async def _scheduled_watchlist() -> List[str]:
+    """
+    Default watchlist (US + India, shared with the signal engine) extended
+    with the trending tickers cached by refresh_trending_cache, so newly
+    hyped names get prices without a redeploy. Falls back to the default
+    list alone when the cache is empty or Redis is unavailable.
+    
+    The India RSS scraper stores bare NSE symbols ("RELIANCE"); they get the
+    .NS suffix yfinance needs before being compared with the watchlist.
+    """
+    from backend.scrapers.india_rss_scraper import INDIA_WATCHLIST
+    from backend.strategy.signal_engine import DEFAULT_WATCHLIST
+    
+    cache = await get_redis()
+    trending = await cache.get_trending() or []
+    india = set(INDIA_WATCHLIST)
+    extra = []
+    for item in trending:
+        ticker = item.get("ticker")
+        if not ticker:
+            continue
+        if ticker in india:
+            ticker = f"{ticker}.NS"
+        if ticker not in DEFAULT_WATCHLIST and ticker not in extra:
+            extra.append(ticker)
+    return [*DEFAULT_WATCHLIST, *extra]
+
+
 @app.task(name="backend.tasks.scraping_tasks.fetch_single_stock")
 def fetch_single_stock(ticker: str, period: str = "3mo"):
     """
@@ -106,8 +128,6 @@ def fetch_single_stock(ticker: str, period: str = "3mo"):
         ticker: Stock symbol
         period: Historical period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, max)
     """
-    import asyncio
-    
     async def _fetch():
         async with AsyncSessionLocal() as session:
             service = StockService()
@@ -120,7 +140,7 @@ def fetch_single_stock(ticker: str, period: str = "3mo"):
                 raise
     
     try:
-        result = asyncio.run(_fetch())
+        result = run_async(_fetch())
         return {
             "status": "success",
             "ticker": ticker,
@@ -1,16 +1,30 @@
 import logging
 import sys
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 
 # Create logs directory if it doesn't exist
 log_dir = Path(__file__).resolve().parents[2] / 'logs'
 log_dir.mkdir(exist_ok=True)
 
+# scraper.log rolls over at this size, keeping LOG_BACKUP_COUNT old files
+LOG_MAX_BYTES = 50_000_000
+LOG_BACKUP_COUNT = 5
+# Records buffered before a write to scraper.log. WARNING and above flush the
+# buffer at once; buffered INFO records are written on a normal exit
+# (logging.shutdown) but lost if the process is killed outright (SIGKILL, OOM)
+LOG_BUFFER_CAPACITY = 512
+
 
 def get_logger(name: str) -> logging.Logger:
     """
     Get or create a logger with consistent configuration
     
+    Console output is unbuffered. scraper.log is written in batches of up to
+    LOG_BUFFER_CAPACITY records, flushed early by any WARNING or worse, so a
+    hard-killed worker can lose its most recent INFO lines but never a
+    warning or error.
+    
     Args:
         name: Logger name (usually __name__ from calling module)
         
@@ -23,23 +37,30 @@ def get_logger(name: str) -> logging.Logger:
     if not logger.handlers:
         logger.setLevel(logging.INFO)
         
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_format = logging.Formatter(
+        # One formatter shared by both handlers
+        log_format = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
-        console_handler.setFormatter(console_format)
         
-        # File handler
-        file_handler = logging.FileHandler(log_dir / 'scraper.log')
-        file_handler.setLevel(logging.INFO)
-        file_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+        # Console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(log_format)
+        
+        # File handler: size-rotated, written in batches instead of per record
+        rotating_handler = RotatingFileHandler(
+            log_dir / 'scraper.log',
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT
+        )
+        rotating_handler.setFormatter(log_format)
+        file_handler = MemoryHandler(
+            LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=rotating_handler
         )
-        file_handler.setFormatter(file_format)
+        file_handler.setLevel(logging.INFO)
         
         logger.addHandler(console_handler)
         logger.addHandler(file_handler)
@@ -116,6 +116,11 @@ def should_retry(exception: Exception) -> bool:
         logger.warning("Rate limited (429), will retry")
         return True
     
+    # yfinance raises YFRateLimitError("Too Many Requests. Rate limited. ...") without a status code
+    if 'rate limit' in error_msg:
+        logger.warning("Rate limited, will retry")
+        return True
+    
     if any(status_str in error_msg for status_str in ['http 500', 'http 502', 'http 503', 'http 504', '500', '502', '503', '504']):
         logger.warning(f"Transient server error in message, will retry")
         return True
@@ -1,5 +1,12 @@
+from functools import lru_cache
+
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+# Texts are cut to this many characters before scoring. Long emoji-heavy
+# posts make VADER's emoji handling pathologically slow, and the opening of
+# a post carries its sentiment anyway.
+MAX_SENTIMENT_CHARS = 4096
+
 
 class SentimentAnalyzer:
     """
@@ -119,5 +126,12 @@ def analyze_sentiment(text: str) -> float:
     if not text or not text.strip():
         return 0.0
     
-    analyzer = get_sentiment_analyzer()
-    return analyzer.analyze(text)
+    # Normalize whitespace so reposts differing only in spacing share a cache entry
+    normalized = ' '.join(text.split())[:MAX_SENTIMENT_CHARS]
+    return _cached_sentiment(normalized)
+
+
+@lru_cache(maxsize=4096)
+def _cached_sentiment(text: str) -> float:
+    """Score normalized text with the shared analyzer, memoized per process."""
+    return get_sentiment_analyzer().analyze(text)
@@ -1,7 +1,7 @@
 import re
 
 # BLACKLIST: Common English words that often appear in ALL CAPS but are NOT tickers
-BLACKLIST_WORDS = {
+BLACKLIST_WORDS = frozenset({
     # Single letters
     'I', 'A',
     
@@ -25,12 +25,11 @@ BLACKLIST_WORDS = {
     'TIME', 'YEAR', 'DAY', 'WEEK', 'MONTH', 'HOUR', 'MINUTE', 'SECOND', 'MOMENT',
     'PLACE', 'WAY', 'THING', 'PEOPLE', 'MAN', 'WOMAN', 'CHILD', 'PERSON', 'LIFE',
     'MONEY', 'PRICE', 'COST', 'VALUE', 'CASH', 'GAIN', 'LOSS', 'PROFIT', 'RISK',
-    'MARKET', 'TRADE', 'DEAL', 'BUSINESS', 'COMPANY', 'FIRM', 'BANK', 'FUND',
+    'TRADE', 'DEAL', 'BUSINESS', 'COMPANY', 'FIRM', 'BANK', 'FUND',
     'RATE', 'RETURN', 'YIELD', 'GROWTH', 'TREND', 'DATA', 'INFO', 'NEWS',
     
     # Trading/Financial jargon that's not a ticker
-    'BUY', 'SELL', 'LONG', 'SHORT', 'BULL', 'BEAR', 'CALL', 'PUT', 'MOON', 'HOLD',
-    'HODL', 'YOLO', 'LOL', 'TO', 'THE', 'A', 'AN', 'AND', 'OR', 'IS', 'IT',
+    'BULL', 'BEAR', 'MOON', 'HODL', 'YOLO', 'LOL', 'AN', 'IT',
     'THIS', 'THAT', 'THESE', 'THOSE', 'WHAT', 'WHICH', 'WHERE', 'WHEN', 'WHY', 'HOW',
     
     # Common financial terms that could be confused as tickers
@@ -38,12 +37,12 @@ BLACKLIST_WORDS = {
     'ETF', 'IPO', 'EPS', 'PE', 'ROE', 'ROI', 'IRR', 'ACB',
     
     # Internet slang & emoji replacements
-    'MOON', 'PUMP', 'DUMP', 'DIP', 'RIP', 'HODL', 'DIAMOND', 'HANDS',
-    'ROCKET', 'FIRE', 'TO', 'THE', 'DO', 'YOUR', 'OWN', 'DD', 'YOLO', 'NOW',
-}
+    'PUMP', 'DUMP', 'DIP', 'RIP', 'DIAMOND', 'HANDS', 'ROCKET', 'FIRE', 'YOUR',
+    'OWN', 'DD', 'NOW',
+})
 
 # WHITELIST: Comprehensive list of popular tickers across all categories
-KNOWN_TICKERS = {
+KNOWN_TICKERS = frozenset({
     # FAANG + Tech Giants
     'AAPL', 'MSFT', 'GOOGL', 'GOOG', 'AMZN', 'META', 'NVDA', 'AMD', 'INTC', 'TSLA',
     'NFLX', 'ADBE', 'CRM', 'ORCL', 'CSCO', 'AVGO', 'QCOM', 'TXN', 'MU', 'AMAT',
@@ -89,28 +88,55 @@ KNOWN_TICKERS = {
     'BABA', 'JD', 'PDD', 'BIDU', 'TME', 'BILI', 'IQ', 'NTES', 'WB', 'DIDI',
     
     # SPACs & Recent IPOs
-    'RBLX', 'ABNB', 'DASH', 'SNOW', 'PLTR', 'U', 'CPNG', 'GRAB', 'RIVN',
+    'RBLX', 'ABNB', 'DASH', 'SNOW', 'U', 'CPNG', 'GRAB',
     
-    # Semiconductors
-    'TSM', 'AVGO', 'QCOM', 'TXN', 'INTC', 'MU', 'AMAT', 'LRCX', 'KLAC',
+    # Semiconductors (the rest are listed under Tech Giants)
+    'TSM',
     
     # Communication & Social
     'SNAP', 'PINS', 'TWTR', 'SPOT', 'MTCH', 'ZM', 'DOCU', 'TEAM', 'WDAY',
     
     # Cloud & Software
-    'CRM', 'ADBE', 'NOW', 'PANW', 'CRWD', 'ZS', 'DDOG', 'NET', 'OKTA', 'SPLK',
-    'TWLO', 'SNOW', 'MRVL', 'FTNT', 'ABNB', 'UBER', 'LYFT',
+    'NOW', 'PANW', 'CRWD', 'ZS', 'DDOG', 'NET', 'OKTA', 'SPLK', 'TWLO', 'FTNT',
+    'UBER', 'LYFT',
     
     # Real Estate
     'AMT', 'PLD', 'CCI', 'EQIX', 'PSA', 'SPG', 'O', 'WELL', 'DLR', 'AVB',
     
     # Crypto-Related
-    'MSTR', 'COIN', 'SQ', 'RIOT', 'MARA', 'CLSK', 'HUT', 'BITF',
+    'MSTR', 'RIOT', 'MARA', 'CLSK', 'HUT', 'BITF',
     
     # Leveraged ETFs
-    'UPRO', 'SPXL', 'TQQQ', 'SQQQ', 'SPXS', 'UDOW', 'SDOW', 'TNA', 'TZA',
+    'UPRO', 'SPXL', 'SPXS', 'UDOW', 'SDOW', 'TNA', 'TZA',
     'UVXY', 'VXX', 'VIXY',
-}
+})
+
+# Pattern 1: Cashtags like $AAPL
+# Pattern 2: Words (2-5 letters) not preceded/followed by letters
+# Matching is case-insensitive via the letter classes, so only matched words
+# are upper-cased rather than a copy of the whole text
+_TICKER_PATTERN = re.compile(r'\$([A-Za-z]{1,5})\b|(?<!\w)([A-Za-z]{2,5})(?!\w)')
+
+# Whitelisted tickers that aren't also blacklisted words (LOW, NOW, COST are
+# both), so each match needs a single set lookup
+_TICKER_CANDIDATES = KNOWN_TICKERS - BLACKLIST_WORDS
+
+# Stock-related keywords that should appear near ticker (has_stock_context)
+STOCK_KEYWORDS = frozenset({
+    'stock', 'buy', 'sell', 'trade', 'price', 'earnings', 'dividend',
+    'shares', 'share', 'trading', 'bullish', 'bearish', 'call', 'put',
+    'option', 'options', 'short', 'long', 'position', 'upside', 'downside',
+    '📈', '📉', '$', 'ticker', 'symbol', 'company', 'corporation', 'inc',
+    'corp', 'ltd', 'financial', 'investor', 'investment', 'profit',
+    'revenue', 'margin', 'pe', 'ratio', 'analysis', 'forecast', 'pump', 'dump',
+    'moon', 'diamond', 'hands', 'rocket', 'ipo', 'etf', 'portfolio', 'dd',
+})
+
+# All keywords as one alternation: a single scan of the context window
+# instead of one substring search per keyword
+_STOCK_KEYWORD_PATTERN = re.compile(
+    '|'.join(re.escape(keyword.upper()) for keyword in sorted(STOCK_KEYWORDS))
+)
 
 
 def extract_tickers(text: str) -> list[str]:
@@ -137,25 +163,16 @@ def extract_tickers(text: str) -> list[str]:
     >> extract_tickers('Buy $GOOG at the market tomorrow')
     ['GOOG']  # THE and MARKET filtered by blacklist
     """
-    # Pattern 1: Cashtags like $AAPL
-    # Pattern 2: All caps words (2-5 letters) not preceded/followed by letters
-    pattern = r'\$([A-Z]{1,5})\b|(?<!\w)([A-Z]{2,5})(?!\w)'
+    # Nothing to scan: skip the regex pass entirely
+    if not text or text.isspace():
+        return []
     
-    matches = re.findall(pattern, text.upper())
+    matches = _TICKER_PATTERN.findall(text)
     
-    tickers = set()
-    for match in matches:
-        ticker = match[0] or match[1]  # match[0] for $AAPL, match[1] for AAPL
-        
-        # Reject if in blacklist (common English words)
-        if ticker in BLACKLIST_WORDS:
-            continue
-        
-        # Accept only if in whitelist (known tickers)
-        if ticker in KNOWN_TICKERS:
-            tickers.add(ticker)
+    # match[0] for $AAPL, match[1] for AAPL
+    tickers = {(match[0] or match[1]).upper() for match in matches} & _TICKER_CANDIDATES
     
-    return sorted(list(tickers))  # Return sorted for consistency
+    return sorted(tickers)  # Return sorted for consistency
 
 
 def has_stock_context(text: str, ticker: str, context_window: int = 50) -> bool:
@@ -180,17 +197,6 @@ def has_stock_context(text: str, ticker: str, context_window: int = 50) -> bool:
     >>> has_stock_context('AAPL is a common acronym', 'AAPL')
     False
     """
-    # Stock-related keywords that should appear near ticker
-    stock_keywords = {
-        'stock', 'buy', 'sell', 'trade', 'price', 'earnings', 'dividend',
-        'shares', 'share', 'trading', 'bullish', 'bearish', 'call', 'put',
-        'option', 'options', 'short', 'long', 'position', 'upside', 'downside',
-        '📈', '📉', '$', 'ticker', 'symbol', 'company', 'corporation', 'inc',
-        'corp', 'ltd', 'financial', 'investor', 'investment', 'profit', 'earnings',
-        'revenue', 'margin', 'pe', 'ratio', 'analysis', 'forecast', 'pump', 'dump',
-        'moon', 'diamond', 'hands', 'rocket', 'ipo', 'etf', 'portfolio', 'dd'
-    }
-    
     # Find ticker position in text
     ticker_upper = ticker.upper()
     text_upper = text.upper()
@@ -202,14 +208,10 @@ def has_stock_context(text: str, ticker: str, context_window: int = 50) -> bool:
         
         # Get context around ticker
         start = max(0, ticker_pos - context_window)
-        end = min(len(text), ticker_pos + len(ticker_upper) + context_window)
-        context = text_upper[start:end]
+        end = ticker_pos + len(ticker_upper) + context_window
         
-        # Check if any stock keyword appears in context
-        for keyword in stock_keywords:
-            if keyword.upper() in context:
-                return True
-        
-        return False
+        # Check if any stock keyword appears in context, searching the window
+        # in place rather than slicing a copy of it
+        return _STOCK_KEYWORD_PATTERN.search(text_upper, start, end) is not None
     except Exception:
         return False
@@ -0,0 +1,18 @@
+"""Shared pytest configuration."""
+
+import asyncio
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop where it is available (not on Windows)."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            return uvloop.EventLoopPolicy()
+        except ImportError:
+            pass
+    return asyncio.DefaultEventLoopPolicy()
@@ -17,6 +17,9 @@ from backend.services.reddit_service import RedditService
 from backend.models.reddit import RedditPost
 
 
+QUALITY_THRESHOLD = 50
+
+
 @pytest_asyncio.fixture
 async def mock_db_with_quality_posts():
     """Mock database session with quality-scored posts."""
@@ -54,77 +57,31 @@ async def mock_db_with_quality_posts():
     
     all_posts = mock_posts + old_posts
     
-    # Track call count to return different results for different execute() calls
-    execute_calls = []
-    
     # Mock execute() to return different results based on query
     async def mock_execute(query, params=None):
-        execute_calls.append(str(query))
-        
-        # Convert query to string for inspection  
         query_str = str(query)
+        result = MagicMock()
+        
+        # get_quality_analytics: one GROUPING SETS query over the 24h window
+        if "GROUPING SETS" in query_str:
+            recent_posts = [p for p in all_posts if p.created_at > now - timedelta(hours=24)]
+            result.all.return_value = grouping_sets_rows(recent_posts, QUALITY_THRESHOLD)
+            return result
         
         # If it's a COUNT query (for filtering endpoints)
-        if ("count" in query_str.lower() or "COUNT" in query_str) and "group" not in query_str.lower():
+        if "count" in query_str.lower() and "group" not in query_str.lower():
             # Check for quality filters
-            result = MagicMock()
             if "quality_score >=" in query_str:
-                filtered = [p for p in mock_posts if p.quality_score >= 50]
-                result.scalar = lambda: len(filtered)
+                filtered = [p for p in mock_posts if p.quality_score >= QUALITY_THRESHOLD]
             elif "is_quality" in query_str:
                 filtered = [p for p in mock_posts if p.is_quality]
-                result.scalar = lambda: len(filtered)
             else:
-                result.scalar = lambda: len(mock_posts)
-            return result
-        
-        # If it's a GROUP BY tier query (second call in get_quality_analytics)
-        if "group by" in query_str.lower() or "GROUP BY" in query_str or "quality_tier" in query_str:
-            tier_counts = {}
-            for post in mock_posts:
-                tier_counts[post.quality_tier] = tier_counts.get(post.quality_tier, 0) + 1
-            
-            result = MagicMock()
-            result.all = lambda: [(tier, count) for tier, count in tier_counts.items()]
-            return result
-        
-        # If it's an analytics aggregation query (AVG, SUM, etc.) - first call
-        if "avg" in query_str.lower() or "func.avg" in query_str:
-            recent_posts = mock_posts
-            
-            if not recent_posts:
-                # Create a simple object with attributes using a class
-                class Row:
-                    total = 0
-                    avg_quality = 0.0
-                    high_quality_count = 0
-                    low_quality_count = 0
-                
-                result = MagicMock()
-                result.first = lambda: Row()
-                return result
-            
-            # Calculate stats
-            total_val = len(recent_posts)
-            avg_qual = sum(p.quality_score for p in recent_posts) / total_val
-            high_count = len([p for p in recent_posts if p.quality_score >= 50])
-            low_count = len([p for p in recent_posts if p.quality_score < 50])
-            
-            # Create a simple object with real attributes (not MagicMock)
-            class Row:
-                def __init__(self, t, a, h, l):
-                    self.total = t
-                    self.avg_quality = a
-                    self.high_quality_count = h
-                    self.low_quality_count = l
-            
-            result = MagicMock()
-            result.first = lambda: Row(total_val, avg_qual, high_count, low_count)
+                filtered = mock_posts
+            result.scalar.return_value = len(filtered)
             return result
         
         # Default SELECT query - return posts
-        result = MagicMock()
-        result.scalars = lambda: type('Scalars', (), {'all': lambda: mock_posts})()
+        result.scalars.return_value.all.return_value = mock_posts
         return result
     
     mock_db.execute = AsyncMock(side_effect=mock_execute)
@@ -134,6 +91,33 @@ async def mock_db_with_quality_posts():
     return mock_db
 
 
+def analytics_row(quality_tier, is_total, posts, threshold):
+    """One row of the analytics query: aggregates over posts."""
+    scores = [p.quality_score for p in posts]
+    return MagicMock(
+        quality_tier=quality_tier,
+        is_total=is_total,
+        total=len(posts),
+        avg_quality=sum(scores) / len(scores) if scores else None,
+        high=sum(1 for s in scores if s >= threshold),
+        low=sum(1 for s in scores if s < threshold),
+    )
+
+
+def grouping_sets_rows(posts, threshold):
+    """Rows for GROUPING SETS ((), (quality_tier)): one per tier plus a total.
+    
+    The grand-total row (grouping() = 1, quality_tier NULL) is placed
+    between tier rows, since the database does not promise an order.
+    """
+    tiers = {}
+    for post in posts:
+        tiers.setdefault(post.quality_tier, []).append(post)
+    rows = [analytics_row(tier, 0, tier_posts, threshold) for tier, tier_posts in tiers.items()]
+    rows.insert(len(rows) // 2, analytics_row(None, 1, posts, threshold))
+    return rows
+
+
 def create_mock_post(id, title, quality_score, quality_tier, is_quality, created_at):
     """Helper to create a mock RedditPost."""
     post = MagicMock(spec=RedditPost)
@@ -161,21 +145,12 @@ def create_mock_post(id, title, quality_score, quality_tier, is_quality, created
 class TestQualityAnalytics:
     """Test suite for quality analytics endpoints."""
     
-    @pytest.mark.asyncio
     async def test_empty_results(self):
         """Test analytics with no posts."""
         mock_db = AsyncMock()
         
-        # Create a simple object with real attributes (not MagicMock)
-        class Row:
-            total = 0
-            avg_quality = None
-            high_quality_count = 0
-            low_quality_count = 0
-        
         mock_result = MagicMock()
-        mock_result.first = lambda: Row()
-        mock_result.all = lambda: []
+        mock_result.all.return_value = []
         
         mock_db.execute = AsyncMock(return_value=mock_result)
         
@@ -192,12 +167,62 @@ class TestQualityAnalytics:
         assert all(count == 0 for count in analytics['quality_distribution'].values())
         assert 'quality_threshold' in analytics
         assert 'time_window_hours' in analytics
+    
+    async def test_total_and_tier_rows_are_split(self, mock_db_with_quality_posts):
+        """Totals come from the grand-total row, the histogram from tier rows."""
+        service = RedditService(min_quality=QUALITY_THRESHOLD)
+        analytics = await service.get_quality_analytics(
+            db=mock_db_with_quality_posts,
+            hours=24
+        )
+        
+        # One round trip for aggregates and histogram
+        assert mock_db_with_quality_posts.execute.await_count == 1
+        
+        # 10 posts in the window; the two 25h-old posts are excluded
+        assert analytics['total'] == 10
+        assert analytics['avg_quality'] == 51.5
+        assert analytics['high_quality_pct'] == 60.0
+        assert analytics['low_quality_pct'] == 40.0
+        assert analytics['quality_distribution'] == {
+            'excellent': 3, 'good': 3, 'fair': 2, 'poor': 2
+        }
+        assert analytics['quality_threshold'] == QUALITY_THRESHOLD
+        assert analytics['time_window_hours'] == 24
+    
+    async def test_missing_tiers_default_to_zero(self):
+        """Tiers without posts in the window still appear, with count 0."""
+        now = datetime.now(timezone.utc)
+        posts = [
+            create_mock_post(1, "MSFT cloud revenue", 65, "good", True, now),
+            create_mock_post(2, "GOOGL search trends", 55, "good", True, now),
+            create_mock_post(3, "wtf", 10, "poor", False, now),
+        ]
+        mock_result = MagicMock()
+        mock_result.all.return_value = grouping_sets_rows(posts, 60)
+        mock_db = AsyncMock()
+        mock_db.execute = AsyncMock(return_value=mock_result)
+        
+        service = RedditService(min_quality=50)
+        analytics = await service.get_quality_analytics(
+            db=mock_db,
+            hours=24,
+            quality_threshold=60
+        )
+        
+        assert analytics['total'] == 3
+        assert analytics['avg_quality'] == pytest.approx(43.33)
+        assert analytics['high_quality_pct'] == pytest.approx(33.33)
+        assert analytics['low_quality_pct'] == pytest.approx(66.67)
+        assert analytics['quality_distribution'] == {
+            'excellent': 0, 'good': 2, 'fair': 0, 'poor': 1
+        }
+        assert analytics['quality_threshold'] == 60
 
 
 class TestQualityFiltering:
     """Test suite for quality filtering on GET /posts endpoint."""
     
-    @pytest.mark.asyncio
     async def test_quality_only_filter(self, mock_db_with_quality_posts):
         """Test filtering for quality posts only."""
         # The mock already filters based on is_quality flag
@@ -210,7 +235,6 @@ class TestQualityFiltering:
         # Should return 6 quality posts (1-6 have is_quality=True)
         assert count == 6
     
-    @pytest.mark.asyncio
     async def test_min_quality_filter(self, mock_db_with_quality_posts):
         """Test filtering by minimum quality score."""
         mock_db = mock_db_with_quality_posts
@@ -10,10 +10,12 @@ Tests:
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 from datetime import datetime, timedelta
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event, func, insert, or_, select, text, update
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from backend.models.reddit import RedditPost
 from backend.database.config import Base
@@ -28,26 +30,76 @@ from backend.database.quality_migration import (
 # Use in-memory SQLite for testing
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# GROUPING SETS, ::casts and pg_indexes have no SQLite equivalent
+postgres_only = pytest.mark.skipif(
+    TEST_DATABASE_URL.startswith("sqlite"),
+    reason="uses PostgreSQL-only SQL"
+)
+
+# Raw SQL used by the tests, wrapped once so each statement is built a single time
+Q_TABLE_EXISTS = text("SELECT 1 FROM sqlite_master WHERE type='table' AND name='reddit_posts'")
+Q_FIRST_POST = text("SELECT * FROM reddit_posts LIMIT 1")
+Q_FIRST_QUALITY = text("SELECT quality_score, quality_tier FROM reddit_posts LIMIT 1")
+Q_TEST_POST_IS_QUALITY = text("SELECT is_quality FROM reddit_posts WHERE post_id='test_quality_col'")
+Q_COUNT_IS_QUALITY = text("SELECT COUNT(*) FROM reddit_posts WHERE is_quality = true")
+Q_COUNT_SCORE_OVER_60 = text("SELECT COUNT(*) FROM reddit_posts WHERE quality_score > 60")
+Q_RESET_IS_QUALITY = text("UPDATE reddit_posts SET is_quality = false")
+# Both threshold checks in one round trip: true values must have quality_score >= 50,
+# false values must have quality_score < 50
+Q_THRESHOLD_MISMATCHES = text(
+    "SELECT "
+    "COALESCE(SUM(CASE WHEN is_quality = true AND quality_score < 50 THEN 1 ELSE 0 END), 0), "
+    "COALESCE(SUM(CASE WHEN is_quality = false AND quality_score >= 50 THEN 1 ELSE 0 END), 0) "
+    "FROM reddit_posts"
+)
+Q_COUNT_IS_QUALITY_AND_TOTAL = text(
+    "SELECT COALESCE(SUM(CASE WHEN is_quality = true THEN 1 ELSE 0 END), 0), COUNT(*) "
+    "FROM reddit_posts"
+)
+
+
+# One row per quality tier: (tier, subreddit, title, body, author, score,
+# score step, comments, comments step, upvote_ratio, tickers, quality_score, age)
+SAMPLE_TIERS = (
+    # Excellent quality posts (80+)
+    ("excellent", "wallstreetbets", "Excellent post {i}", "This is high quality content" * 10,
+     "user_{i}", 1000, 1, 100, 1, 0.95, ('AAPL', 'TSLA'), 85.0, lambda i: timedelta(hours=i)),
+    # Good quality posts (50-70)
+    ("good", "stocks", "Good post {i}", "This is decent quality content" * 5,
+     "user_{i}", 100, 1, 10, 1, 0.75, ('MSFT',), 60.0, lambda i: timedelta(hours=20 + i)),
+    # Fair quality posts (30-50)
+    ("fair", "investing", "Fair post {i}", "Basic content",
+     "user_{i}", 10, 1, 2, 1, 0.55, ('GOOGL',), 40.0, lambda i: timedelta(days=1)),
+    # Poor quality posts (<30)
+    ("poor", "memes", "Low quality {i}", "spam",
+     "spammer", 1, 0, 0, 0, 0.3, (), 15.0, lambda i: timedelta(days=2)),
+)
 
-@pytest.fixture
-async def test_db():
-    """Create test database and tables."""
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_db():
+    """Create the in-memory engine and tables once for the whole module."""
     engine = create_async_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
         echo=False
     )
     
+    # Let SQLAlchemy own BEGIN so per-test SAVEPOINTs work under the sqlite driver
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
-    # Create session maker
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-    
-    yield async_session
+    yield engine
     
     # Cleanup
     async with engine.begin() as conn:
@@ -55,87 +107,50 @@ async def test_db():
     await engine.dispose()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="module")
+async def test_db(shared_db):
+    """Session maker joined to a per-test transaction that is rolled back afterwards.
+    
+    Commits inside the test only release a SAVEPOINT, so every test starts
+    from empty tables without re-creating them.
+    """
+    async with shared_db.connect() as conn:
+        trans = await conn.begin()
+        yield async_sessionmaker(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
 async def sample_posts(test_db):
     """Create sample posts with various quality scores."""
+    now = datetime.utcnow()
+    posts = [
+        dict(
+            post_id=f"post_{tier}_{i}",
+            subreddit=subreddit,
+            title=title.format(i=i),
+            body=body,
+            author=author.format(i=i),
+            score=score + score_step * i,
+            num_comments=comments + comments_step * i,
+            upvote_ratio=upvote_ratio,
+            tickers=list(tickers),
+            quality_score=quality_score + i,
+            quality_tier=tier,
+            created_at=now - age(i)
+        )
+        for (tier, subreddit, title, body, author, score, score_step, comments,
+             comments_step, upvote_ratio, tickers, quality_score, age) in SAMPLE_TIERS
+        for i in range(10)
+    ]
+    
     async with test_db() as session:
-        posts = [
-            # Excellent quality posts (80+)
-            RedditPost(
-                post_id=f"post_excellent_{i}",
-                subreddit="wallstreetbets",
-                title=f"Excellent post {i}",
-                body="This is high quality content" * 10,
-                author=f"user_{i}",
-                score=1000 + i,
-                num_comments=100 + i,
-                upvote_ratio=0.95,
-                tickers=['AAPL', 'TSLA'],
-                quality_score=85.0 + i,
-                quality_tier='excellent',
-                created_at=datetime.utcnow() - timedelta(hours=i)
-            )
-            for i in range(10)
-        ]
-        
-        posts.extend([
-            # Good quality posts (50-70)
-            RedditPost(
-                post_id=f"post_good_{i}",
-                subreddit="stocks",
-                title=f"Good post {i}",
-                body="This is decent quality content" * 5,
-                author=f"user_{i}",
-                score=100 + i,
-                num_comments=10 + i,
-                upvote_ratio=0.75,
-                tickers=['MSFT'],
-                quality_score=60.0 + i,
-                quality_tier='good',
-                created_at=datetime.utcnow() - timedelta(hours=20 + i)
-            )
-            for i in range(10)
-        ])
-        
-        posts.extend([
-            # Fair quality posts (30-50)
-            RedditPost(
-                post_id=f"post_fair_{i}",
-                subreddit="investing",
-                title=f"Fair post {i}",
-                body="Basic content",
-                author=f"user_{i}",
-                score=10 + i,
-                num_comments=2 + i,
-                upvote_ratio=0.55,
-                tickers=['GOOGL'],
-                quality_score=40.0 + i,
-                quality_tier='fair',
-                created_at=datetime.utcnow() - timedelta(days=1)
-            )
-            for i in range(10)
-        ])
-        
-        posts.extend([
-            # Poor quality posts (<30)
-            RedditPost(
-                post_id=f"post_poor_{i}",
-                subreddit="memes",
-                title=f"Low quality {i}",
-                body="spam",
-                author="spammer",
-                score=1,
-                num_comments=0,
-                upvote_ratio=0.3,
-                tickers=[],
-                quality_score=15.0 + i,
-                quality_tier='poor',
-                created_at=datetime.utcnow() - timedelta(days=2)
-            )
-            for i in range(10)
-        ])
-        
-        session.add_all(posts)
+        # One executemany INSERT of plain dicts: no ORM instances to track
+        await session.execute(insert(RedditPost), posts)
         await session.commit()
     
     return test_db
@@ -144,194 +159,169 @@ async def sample_posts(test_db):
 class TestSchemaVerification:
     """Verify database schema is correct."""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_reddit_posts_table_exists(self, test_db):
         """Verify reddit_posts table exists with correct columns."""
         async with test_db() as session:
             # Try simple query to verify table exists
-            result = await session.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='reddit_posts'")
+            result = await session.execute(Q_TABLE_EXISTS)
             assert result.scalar() == 1
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_quality_columns_exist(self, sample_posts):
         """Verify quality-related columns exist."""
         async with sample_posts() as session:
-            result = await session.execute("SELECT * FROM reddit_posts LIMIT 1")
+            result = await session.execute(Q_FIRST_POST)
             row = result.first()
             
             # Verify columns by executing query that uses them
-            quality_result = await session.execute(
-                "SELECT quality_score, quality_tier FROM reddit_posts LIMIT 1"
-            )
+            quality_result = await session.execute(Q_FIRST_QUALITY)
             assert quality_result.first() is not None
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_is_quality_column_exists(self, test_db):
         """Verify is_quality boolean column exists."""
         async with test_db() as session:
-            try:
-                # Add a test post and try to set is_quality
-                post = RedditPost(
-                    post_id="test_quality_col",
-                    subreddit="test",
-                    title="Test post",
-                    body="Testing",
-                    quality_score=75.0,
-                    quality_tier='good',
-                    is_quality=True,
-                    created_at=datetime.utcnow()
-                )
-                session.add(post)
-                await session.commit()
-                
-                # Verify we can query it
-                result = await session.execute(
-                    "SELECT is_quality FROM reddit_posts WHERE post_id='test_quality_col'"
-                )
-                row = result.first()
-                assert row is not None
-            except Exception as e:
-                # SQLite doesn't support all PostgreSQL features
-                # Just verify the model has the field
-                assert hasattr(RedditPost, 'is_quality')
+            # Add a test post and set is_quality
+            post = RedditPost(
+                post_id="test_quality_col",
+                subreddit="test",
+                title="Test post",
+                body="Testing",
+                quality_score=75.0,
+                quality_tier='good',
+                is_quality=True,
+                created_at=datetime.utcnow()
+            )
+            session.add(post)
+            await session.commit()
+            
+            # Verify we can query it
+            result = await session.execute(Q_TEST_POST_IS_QUALITY)
+            row = result.first()
+            assert row is not None
+            assert row[0]
 
 
 class TestDataMigration:
     """Test is_quality field population."""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_populate_is_quality_field(self, sample_posts):
         """Test populating is_quality based on quality_score."""
         async with sample_posts() as session:
             # Initially all should be False (default)
-            result = await session.execute(
-                "SELECT COUNT(*) FROM reddit_posts WHERE is_quality = true"
-            )
+            result = await session.execute(Q_COUNT_IS_QUALITY)
             initial_true_count = result.scalar()
             assert initial_true_count == 0
             
+            # Stale flags from an earlier scoring run: poor posts marked quality
+            await session.execute(
+                update(RedditPost).where(RedditPost.quality_tier == 'poor').values(is_quality=True)
+            )
+            
             # Populate with threshold 50
             update_result = await populate_is_quality_field(session, quality_threshold=50.0)
             
             assert update_result['threshold'] == 50.0
-            assert update_result['high_quality'] > 0  # Should have 30 posts >= 50
-            assert update_result['low_quality'] > 0   # Should have 10 posts < 50
-            assert update_result['updated'] > 0
+            assert update_result['high_quality'] == 20  # excellent + good set to True
+            assert update_result['low_quality'] == 10   # stale poor flags reset to False
+            assert update_result['updated'] == 30
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_is_quality_threshold_correctness(self, sample_posts):
         """Verify is_quality field truly reflects quality_score threshold."""
         async with sample_posts() as session:
             await populate_is_quality_field(session, quality_threshold=50.0)
             
-            # Verify all true values have quality_score >= 50
-            below_threshold = await session.execute(
-                "SELECT COUNT(*) FROM reddit_posts WHERE is_quality = true AND quality_score < 50"
-            )
-            assert below_threshold.scalar() == 0
-            
-            # Verify all false values have quality_score < 50
-            above_threshold = await session.execute(
-                "SELECT COUNT(*) FROM reddit_posts WHERE is_quality = false AND quality_score >= 50"
-            )
-            assert above_threshold.scalar() == 0
+            result = await session.execute(Q_THRESHOLD_MISMATCHES)
+            below_threshold, above_threshold = result.one()
+            assert below_threshold == 0
+            assert above_threshold == 0
 
 
 class TestQualityDistribution:
     """Test quality distribution analysis."""
     
-    @pytest.mark.asyncio
+    @postgres_only
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_analyze_quality_distribution(self, sample_posts):
         """Test quality distribution calculation."""
         async with sample_posts() as session:
-            try:
-                distribution = await analyze_quality_distribution(session)
-                
-                # Verify structure
-                assert 'total_posts' in distribution
-                assert 'quality_tiers' in distribution
-                assert 'score_statistics' in distribution
-                
-                # Verify totals
-                assert distribution['total_posts'] == 40  # 10+10+10+10
-                
-                # Verify statistics
-                stats = distribution['score_statistics']
-                assert 'min' in stats
-                assert 'max' in stats
-                assert 'mean' in stats
-                assert stats['min'] >= 15  # Lowest is ~15
-                assert stats['max'] <= 100  # Highest is ~95
-            except Exception:
-                # SQLite might not support all aggregate functions
-                pass
+            distribution = await analyze_quality_distribution(session)
+            
+            # Verify structure
+            assert 'total_posts' in distribution
+            assert 'quality_tiers' in distribution
+            assert 'score_statistics' in distribution
+            
+            # Verify totals
+            assert distribution['total_posts'] == 40  # 10+10+10+10
+            
+            # Verify statistics
+            stats = distribution['score_statistics']
+            assert 'min' in stats
+            assert 'max' in stats
+            assert 'mean' in stats
+            assert stats['min'] >= 15  # Lowest is ~15
+            assert stats['max'] <= 100  # Highest is ~95
     
-    @pytest.mark.asyncio
+    @postgres_only
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_quality_tier_breakdown(self, sample_posts):
         """Test quality tier distribution."""
         async with sample_posts() as session:
-            try:
-                distribution = await analyze_quality_distribution(session)
-                
-                tiers = distribution['quality_tiers']
-                
-                # Should have all 4 tiers
-                assert len(tiers) > 0
-                
-                # Each tier should have count and percentage
-                for tier_name, tier_data in tiers.items():
-                    assert 'count' in tier_data
-                    assert 'percentage' in tier_data
-                    assert tier_data['count'] > 0
-            except Exception:
-                pass
+            distribution = await analyze_quality_distribution(session)
+            
+            tiers = distribution['quality_tiers']
+            
+            # Should have all 4 tiers
+            assert len(tiers) > 0
+            
+            # Each tier should have count and percentage
+            for tier_name, tier_data in tiers.items():
+                assert 'count' in tier_data
+                assert 'percentage' in tier_data
+                assert tier_data['count'] > 0
 
 
 class TestQueryPerformance:
     """Test query performance with indexing."""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_quality_filter_query(self, sample_posts):
         """Test simple is_quality filter query."""
         async with sample_posts() as session:
             # First populate is_quality
             await populate_is_quality_field(session, quality_threshold=50.0)
             
-            # Query high-quality posts
-            result = await session.execute(
-                "SELECT COUNT(*) FROM reddit_posts WHERE is_quality = true"
-            )
-            high_quality_count = result.scalar()
+            # Count high-quality posts and the total in one query
+            result = await session.execute(Q_COUNT_IS_QUALITY_AND_TOTAL)
+            high_quality_count, total_count = result.one()
             
             # Should have more than 0 high-quality posts
             assert high_quality_count > 0
             
             # Should be less than total
-            result = await session.execute("SELECT COUNT(*) FROM reddit_posts")
-            total_count = result.scalar()
             assert high_quality_count < total_count
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_quality_with_time_filter(self, sample_posts):
         """Test composite quality + time filter."""
         async with sample_posts() as session:
             await populate_is_quality_field(session, quality_threshold=50.0)
             
             # Query recent high-quality posts (SQLite time handling)
-            result = await session.execute(
-                "SELECT COUNT(*) FROM reddit_posts WHERE is_quality = true"
-            )
+            result = await session.execute(Q_COUNT_IS_QUALITY)
             count = result.scalar()
             assert count >= 0
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_quality_range_query(self, sample_posts):
         """Test quality_score range queries."""
         async with sample_posts() as session:
             # Query posts with quality_score > 60
-            result = await session.execute(
-                "SELECT COUNT(*) FROM reddit_posts WHERE quality_score > 60"
-            )
+            result = await session.execute(Q_COUNT_SCORE_OVER_60)
             count = result.scalar()
             
             # Should have posts in 60-95 range
@@ -342,80 +332,76 @@ class TestQueryPerformance:
 class TestIndexPerformance:
     """Test index size and performance."""
     
-    @pytest.mark.asyncio
+    @postgres_only
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_quality_index_performance(self, sample_posts):
         """Test index performance statistics (PostgreSQL only)."""
         async with sample_posts() as session:
-            try:
-                stats = await get_quality_index_performance(session)
-                
-                # For SQLite, this will fail, but that's OK
-                # For PostgreSQL, should return index information
-                if stats and 'table_stats' in stats:
-                    assert stats['table_stats']['total_rows'] > 0
-            except Exception:
-                # SQLite doesn't support full index analysis
-                pass
+            stats = await get_quality_index_performance(session)
+            
+            if stats and 'table_stats' in stats:
+                assert stats['table_stats']['total_rows'] > 0
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_benchmark_quality_queries(self, sample_posts):
         """Test query performance benchmarking."""
         async with sample_posts() as session:
             await populate_is_quality_field(session, quality_threshold=50.0)
             
-            try:
-                benchmarks = await benchmark_quality_queries(session)
-                
-                # Should have some benchmark results
-                assert len(benchmarks) > 0
-                
-                # Each should have a float result or error
-                for query_name, result in benchmarks.items():
-                    assert isinstance(result, (float, dict))
-            except Exception:
-                # Some queries might not be supported in test SQLite
-                pass
+            benchmarks = await benchmark_quality_queries(session)
+            
+            # Should have some benchmark results
+            assert len(benchmarks) > 0
+            
+            # Each should have a float result or an error (unsupported on SQLite)
+            for query_name, result in benchmarks.items():
+                assert isinstance(result, (float, dict))
 
 
 class TestDataIntegrity:
     """Test data integrity and constraints."""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_quality_score_bounds(self, sample_posts):
         """Verify quality_score stays in 0-100 range."""
         async with sample_posts() as session:
             # All our test data should be in valid range
             result = await session.execute(
-                "SELECT COUNT(*) FROM reddit_posts WHERE quality_score < 0 OR quality_score > 100"
+                select(func.count()).select_from(RedditPost).where(
+                    or_(RedditPost.quality_score < 0, RedditPost.quality_score > 100)
+                )
             )
             invalid_count = result.scalar()
             assert invalid_count == 0
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_quality_tier_valid_values(self, sample_posts):
         """Verify quality_tier only has valid values."""
         async with sample_posts() as session:
             valid_tiers = {'poor', 'fair', 'good', 'excellent'}
             
             result = await session.execute(
-                """
-                SELECT DISTINCT quality_tier FROM reddit_posts 
-                WHERE quality_tier NOT IN ('poor', 'fair', 'good', 'excellent')
-                """
+                select(RedditPost.quality_tier)
+                .where(RedditPost.quality_tier.not_in(valid_tiers))
+                .distinct()
             )
-            invalid_tiers = result.fetchall()
+            invalid_tiers = result.all()
             assert len(invalid_tiers) == 0
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_consistency_quality_score_tier(self, sample_posts):
         """Verify quality_score matches quality_tier thresholds."""
         async with sample_posts() as session:
             # Manual verification (these checks should always pass in our tests)
-            result = await session.execute(
-                "SELECT quality_score, quality_tier FROM reddit_posts"
-            )
+            # Column-only select streamed in batches: plain rows, no ORM instances
+            stmt = select(
+                RedditPost.quality_score, RedditPost.quality_tier
+            ).execution_options(yield_per=100)
+            result = await session.stream(stmt)
             
-            for score, tier in result:
+            checked = 0
+            async for score, tier in result:
+                checked += 1
                 if tier == 'excellent':
                     assert score >= 70
                 elif tier == 'good':
@@ -424,12 +410,15 @@ class TestDataIntegrity:
                     assert 30 <= score < 50
                 elif tier == 'poor':
                     assert score < 30
+            
+            # Every seeded post came through the stream
+            assert checked == 40
 
 
 class TestMigrationRobustness:
     """Test migration robustness and error handling."""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_idempotent_population(self, sample_posts):
         """Test that population can be run multiple times safely."""
         async with sample_posts() as session:
@@ -443,7 +432,7 @@ class TestMigrationRobustness:
             assert result1['updated'] > 0
             assert result2['updated'] == 0  # Nothing to update on second run
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_different_thresholds(self, sample_posts):
         """Test population with different quality thresholds."""
         async with sample_posts() as session:
@@ -451,7 +440,7 @@ class TestMigrationRobustness:
             result_30 = await populate_is_quality_field(session, quality_threshold=30.0)
             
             # Reset
-            await session.execute("UPDATE reddit_posts SET is_quality = false")
+            await session.execute(Q_RESET_IS_QUALITY)
             await session.commit()
             
             # Threshold 70 (should mark fewer as high quality)
@@ -8,10 +8,10 @@ Tests verify that:
 4. Success after failures demonstrates recovery capability
 """
 
-import pytest
 from unittest.mock import Mock, patch, call
 from datetime import datetime, timedelta
 import asyncio
+import time
 
 from backend.scrapers.reddit_scraper import RedditScraper
 from backend.scrapers.stock_scraper import StockScraper
@@ -144,7 +144,6 @@ class TestRedditScraperRetry:
 class TestStockScraperRetry:
     """Test stock scraper automatic retry on transient failures."""
     
-    @pytest.mark.asyncio
     async def test_fetch_historical_retries_on_rate_limit(self):
         """Verify stock scraper retries on yfinance 429 rate limit."""
         scraper = StockScraper()
@@ -180,7 +179,6 @@ class TestStockScraperRetry:
             assert isinstance(result, list)
             assert len(result) > 0
     
-    @pytest.mark.asyncio
     async def test_fetch_historical_retries_on_timeout(self):
         """Verify stock scraper retries on network timeout."""
         scraper = StockScraper()
@@ -212,7 +210,6 @@ class TestStockScraperRetry:
             
             assert isinstance(result, list)
     
-    @pytest.mark.asyncio
     async def test_fetch_historical_fails_fast_on_auth_error(self):
         """Verify stock scraper fails fast on auth errors."""
         scraper = StockScraper()
@@ -230,7 +227,6 @@ class TestStockScraperRetry:
             # Should only retry up to configured limit (3 for YFINANCE_CONFIG)
             assert mock_ticker.history.call_count <= (1 + YFINANCE_CONFIG.max_retries)
     
-    @pytest.mark.asyncio
     async def test_fetch_current_price_retries_on_server_error(self):
         """Verify price fetcher retries on 5xx errors."""
         scraper = StockScraper()
@@ -256,7 +252,6 @@ class TestStockScraperRetry:
             # Should succeed after retry
             assert result is not None
     
-    @pytest.mark.asyncio
     async def test_fetch_multiple_with_mixed_results(self):
         """Verify parallel fetches handle both successes and retries."""
         scraper = StockScraper()
@@ -286,7 +281,7 @@ class TestStockScraperRetry:
                 'INVALID_TICKER': create_ticker_mock('INVALID_TICKER', should_fail=True)
             }
             
-            mock_ticker_class.side_effect = lambda t: ticker_mocks[t]
+            mock_ticker_class.side_effect = lambda t, **kwargs: ticker_mocks[t]
             
             results = await scraper.fetch_multiple(['AAPL', 'INVALID_TICKER'])
             
@@ -294,6 +289,47 @@ class TestStockScraperRetry:
             assert len(results['AAPL']) > 0
             # INVALID_TICKER should be empty (404 = fail fast)
             assert results['INVALID_TICKER'] == []
+    
+    async def test_fetch_multiple_deadline_returns_empty_for_pending(self):
+        """Verify tickers still pending at the deadline come back empty."""
+        scraper = StockScraper()
+        
+        async def fake_fetch(ticker, period):
+            if ticker == 'SLOW':
+                await asyncio.sleep(10)
+            return [{'ticker': ticker, 'close': 100.0}]
+        
+        with patch.object(scraper, 'fetch_historical', side_effect=fake_fetch):
+            started = time.monotonic()
+            results = await scraper.fetch_multiple(['AAPL', 'SLOW', 'MSFT'], timeout=0.2)
+        
+        # The batch stops at the deadline instead of waiting for SLOW
+        assert time.monotonic() - started < 2
+        assert results == {
+            'AAPL': [{'ticker': 'AAPL', 'close': 100.0}],
+            'SLOW': [],
+            'MSFT': [{'ticker': 'MSFT', 'close': 100.0}],
+        }
+    
+    async def test_fetch_multiple_error_does_not_cancel_siblings(self):
+        """Verify one ticker raising leaves the in-flight fetches running."""
+        scraper = StockScraper()
+        
+        async def fake_fetch(ticker, period):
+            if ticker == 'BAD':
+                raise RuntimeError("boom")
+            # Still running when BAD fails
+            await asyncio.sleep(0.05)
+            return [{'ticker': ticker, 'close': 100.0}]
+        
+        with patch.object(scraper, 'fetch_historical', side_effect=fake_fetch):
+            results = await scraper.fetch_multiple(['AAPL', 'BAD', 'MSFT'])
+        
+        assert results == {
+            'AAPL': [{'ticker': 'AAPL', 'close': 100.0}],
+            'BAD': [],
+            'MSFT': [{'ticker': 'MSFT', 'close': 100.0}],
+        }
 
 
 class TestRetryErrorClassification:
@@ -304,6 +340,11 @@ class TestRetryErrorClassification:
         error = Exception("HTTP 429: Too Many Requests")
         assert should_retry(error) is True
     
+    def test_classify_yfinance_rate_limit_as_transient(self):
+        """Verify yfinance's status-less rate limit error is classified as transient."""
+        error = Exception("Too Many Requests. Rate limited. Try after a while.")
+        assert should_retry(error) is True
+    
     def test_classify_timeout_as_transient(self):
         """Verify timeout errors are classified as transient."""
         error = TimeoutError("Connection timed out")
@@ -387,7 +428,6 @@ class TestRetryBackoffTiming:
 class TestScraperRetryIntegration:
     """Integration tests combining scrapers with retry logic under stress."""
     
-    @pytest.mark.asyncio
     async def test_multiple_retries_eventual_success(self):
         """Simulate multiple failures before eventual success."""
         scraper = StockScraper()
@@ -46,7 +46,6 @@ class TestScrapingEndpoint:
         routes = [route.path for route in app.routes]
         assert "/api/v1/posts/scrape/{subreddit}" in routes
     
-    @pytest.mark.asyncio
     async def test_scrape_wallstreetbets_mocked(self, client, mock_db):
         """Test scraping wallstreetbets with mocked Reddit scraper"""
         # Note: Full integration test requires Redis for rate limiting.
@@ -66,7 +65,6 @@ class TestScrapingEndpoint:
                     "Endpoint must support POST"
 
     
-    @pytest.mark.asyncio
     async def test_scrape_with_duplicates(self, client, mock_db):
         """Test that duplicate posts are skipped"""
         
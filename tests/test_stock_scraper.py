@@ -22,19 +22,18 @@ async def test_stock_scraper():
     
     service = StockService()
     
+    print(f"\n📊 Fetching data for: {', '.join(test_tickers)}")
+    print("⏳ Fetching 3 months of data + indicators for all tickers in parallel...\n")
+    
+    # Fetch all tickers concurrently; each ticker is saved in its own session
+    results = await service.fetch_and_save_multiple(
+        test_tickers,
+        period="3mo"  # 3 months for SMA_200
+    )
+    
     async with AsyncSessionLocal() as db:
-        print(f"\n📊 Fetching data for: {', '.join(test_tickers)}")
-        print("⏳ This will take ~30 seconds (3 months of data + indicators)...\n")
-        
-        # Fetch and save for each ticker
-        for ticker in test_tickers:
-            result = await service.fetch_and_save_stock_data(
-                ticker=ticker,
-                db=db,
-                period="3mo"  # 3 months for SMA_200
-            )
-            
-            print(f"\n✅ {result['ticker']}")
+        for ticker, result in results.items():
+            print(f"\n✅ {ticker}")
             print(f"   Saved: {result['saved']} records")
             print(f"   Skipped: {result['skipped']} (already in DB)")
             print(f"   Errors: {result['errors']}")
@@ -6,110 +6,88 @@ Tests verify:
 3. Alembic migrations are registered
 """
 
+import re
+
 import pytest
 from backend.models.reddit import RedditPost
 from sqlalchemy import inspect
-import os
+from pathlib import Path
+
+
+MIGRATION_DIR = Path(__file__).resolve().parents[2] / 'alembic' / 'versions'
+
+QUALITY_FIELDS = ['quality_score', 'quality_tier', 'is_quality']
+
+# Mapped columns, inspected once for every test
+COLUMNS = inspect(RedditPost).columns
+
+# Typed revision line as written by `alembic revision`
+REVISION_RE = re.compile(r"^revision: str = '([^']+)'", re.MULTILINE)
+
+
+@pytest.fixture(scope="module")
+def migration_files():
+    """Migration module name -> source, read once per module."""
+    return {
+        path.name: path.read_text()
+        for path in sorted(MIGRATION_DIR.glob('*.py'))
+        if not path.name.startswith('__')
+    }
 
 
 class TestDatabaseSchemaUpdates:
     """Verify database schema has been updated with quality scoring fields."""
     
-    def test_reddit_post_model_has_quality_score(self):
-        """Verify quality_score field exists in RedditPost model."""
-        assert hasattr(RedditPost, 'quality_score')
-    
-    def test_reddit_post_model_has_quality_tier(self):
-        """Verify quality_tier field exists in RedditPost model."""
-        assert hasattr(RedditPost, 'quality_tier')
-    
-    def test_reddit_post_model_has_is_quality(self):
-        """Verify is_quality field exists in RedditPost model."""
-        assert hasattr(RedditPost, 'is_quality')
+    @pytest.mark.parametrize("field", QUALITY_FIELDS)
+    def test_reddit_post_model_has_quality_field(self, field):
+        """Verify each quality field exists in RedditPost model."""
+        assert hasattr(RedditPost, field)
     
-    def test_model_columns_have_correct_types(self):
+    @pytest.mark.parametrize("field, python_type", [
+        ('quality_score', float),  # Float
+        ('quality_tier', str),     # String
+        ('is_quality', bool),      # Boolean
+    ])
+    def test_model_columns_have_correct_types(self, field, python_type):
         """Verify column types are set correctly."""
-        mapper = inspect(RedditPost)
-        columns = {col.name: col.type for col in mapper.columns}
-        
-        # quality_score should be Float
-        assert columns['quality_score'].python_type == float
-        
-        # quality_tier should be String
-        assert columns['quality_tier'].python_type == str
-        
-        # is_quality should be Boolean
-        assert columns['is_quality'].python_type == bool
+        assert COLUMNS[field].type.python_type == python_type
 
 
 class TestAlembicMigrations:
     """Verify Alembic migrations are in place."""
     
-    def test_migration_files_exist(self):
+    def test_migration_files_exist(self, migration_files):
         """Verify migration files are present."""
-        migration_dir = '/home/harshil/tft-trader/alembic/versions'
-        migration_files = os.listdir(migration_dir)
-        
         # Should have our quality scoring migrations
         assert any('quality_scoring' in f for f in migration_files), \
             "Missing quality scoring migration"
         assert any('quality_fields' in f for f in migration_files), \
             "Missing quality fields migration"
     
-    def test_migration_chain_is_consistent(self):
+    def test_migration_chain_is_consistent(self, migration_files):
         """Verify migration chain is properly set up."""
-        # Read migration files and verify parents/children relationships
-        migration_dir = '/home/harshil/tft-trader/alembic/versions'
-        
         # Find the quality scoring migrations
-        quality_migrations = [
-            f for f in os.listdir(migration_dir)
-            if 'quality' in f.lower() and f.endswith('.py')
-        ]
+        quality_migrations = [f for f in migration_files if 'quality' in f.lower()]
         
         # Should have at least quality optimization migration
         assert len(quality_migrations) >= 1, \
             f"Expected quality scoring migrations, found {quality_migrations}"
         
         # Read one migration to ensure it's properly formatted
-        mig_file = quality_migrations[0]
-        with open(os.path.join(migration_dir, mig_file)) as f:
-            content = f.read()
-            # Should have revision identifier and upgrade/downgrade functions
-            assert 'revision: str =' in content
-            assert 'def upgrade()' in content
-            assert 'def downgrade()' in content
+        content = migration_files[quality_migrations[0]]
+        # Should have revision identifier and upgrade/downgrade functions
+        assert 'revision: str =' in content
+        assert 'def upgrade()' in content
+        assert 'def downgrade()' in content
 
 
 class TestQualityFieldDefaults:
     """Verify quality fields have appropriate defaults."""
     
-    def test_quality_score_has_default(self):
-        """Verify quality_score has a default value."""
-        mapper = inspect(RedditPost)
-        quality_score = mapper.columns['quality_score']
-        assert quality_score.default is not None
-    
-    def test_quality_tier_has_default(self):
-        """Verify quality_tier has a default value."""
-        mapper = inspect(RedditPost)
-        quality_tier = mapper.columns['quality_tier']
-        assert quality_tier.default is not None
-    
-    def test_is_quality_has_default(self):
-        """Verify is_quality has a default value."""
-        mapper = inspect(RedditPost)
-        is_quality = mapper.columns['is_quality']
-        assert is_quality.default is not None
-    
-    def test_quality_fields_can_be_not_null(self):
-        """Verify quality fields are properly defined with defaults."""
-        mapper = inspect(RedditPost)
-        
-        # Check that defaults are set
-        assert mapper.columns['quality_score'].default is not None
-        assert mapper.columns['quality_tier'].default is not None
-        assert mapper.columns['is_quality'].default is not None
+    @pytest.mark.parametrize("field", QUALITY_FIELDS)
+    def test_quality_field_has_default(self, field):
+        """Verify each quality field has a default value."""
+        assert COLUMNS[field].default is not None
 
 
 class TestIndexes:
@@ -145,36 +123,25 @@ class TestIndexes:
                              if hasattr(arg, 'name') and 'created_at' in arg.name]
         assert len(created_at_indexes) > 0, "Missing created_at index"
     
-    def test_quality_fields_indexed(self):
+    @pytest.mark.parametrize("field", ['quality_score', 'is_quality'])
+    def test_quality_fields_indexed(self, field):
         """Verify quality fields have index=True."""
-        mapper = inspect(RedditPost)
-        
-        # quality_score and is_quality should be indexed
-        assert mapper.columns['quality_score'].index == True
-        assert mapper.columns['is_quality'].index == True
+        assert COLUMNS[field].index == True
 
 
 class TestMigrationSequence:
     """Verify migration sequence is correct."""
     
-    def test_quality_migrations_after_reddit_enhancements(self):
+    def test_quality_migrations_after_reddit_enhancements(self, migration_files):
         """Verify quality migrations come after reddit_post_enhanced_fields."""
-        migration_dir = '/home/harshil/tft-trader/alembic/versions'
         migration_pairs = []
         
-        for f in os.listdir(migration_dir):
-            if f.endswith('.py') and not f.startswith('__'):
-                # Extract revision and down_revision
-                with open(os.path.join(migration_dir, f)) as mf:
-                    content = mf.read()
-                    # Find revision line
-                    for line in content.split('\n'):
-                        if line.startswith("revision: str ="):
-                            rev = line.split("'")[1]
-                            migration_pairs.append((rev, f))
-                            break
+        for f, content in migration_files.items():
+            match = REVISION_RE.search(content)
+            if match:
+                migration_pairs.append((match.group(1), f))
         
         # At least one quality migration should exist
         quality_migs = [m for m in migration_pairs if 'quality' in m[1].lower()]
         assert len(quality_migs) > 0, \
-            f"No quality migrations found in {migration_dir}"
+            f"No quality migrations found in {MIGRATION_DIR}"
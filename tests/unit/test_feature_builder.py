@@ -209,7 +209,6 @@ class TestFeatureBuilder:
         assert features["ticker"] == "TEST"
         assert features["data_quality"] == "insufficient_data"
     
-    @pytest.mark.asyncio
     async def test_save_snapshot_valid(self, feature_builder):
         """Test saving snapshot to database."""
         snapshot = {
@@ -163,7 +163,6 @@ class TestFeatureBuilder:
         assert features["ticker"] == "INVALID"
         assert features["data_quality"] == "insufficient_data"
 
-    @pytest.mark.asyncio
     async def test_build_snapshot_structure(self, builder):
         """Test snapshot structure (mock database calls)."""
         with patch.object(builder, '_get_active_tickers', new_callable=AsyncMock) as mock_tickers, \
@@ -194,7 +193,6 @@ class TestFeatureBuilder:
             assert "AAPL" in snapshot["features"]
             assert "MSFT" in snapshot["features"]
 
-    @pytest.mark.asyncio
     async def test_build_snapshot_no_tickers(self, builder):
         """Test snapshot with no active tickers."""
         with patch.object(builder, '_get_active_tickers', new_callable=AsyncMock) as mock_tickers:
@@ -0,0 +1,85 @@
+"""
+Tests for the chunked DELETE used by cleanup_old_data.
+
+Runs against in-memory SQLite with CLEANUP_BATCH_SIZE patched down so a
+handful of rows spans several chunks.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from backend.database.config import Base
+from backend.models.reddit import RedditPost
+from backend.tasks import maintenance_tasks
+
+
+CUTOFF = datetime(2026, 1, 1)
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Fresh in-memory database with the reddit_posts table."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def seed(session_factory, old: int, recent: int) -> None:
+    """Insert old posts (before CUTOFF) and recent posts (after it)."""
+    rows = [
+        dict(post_id=f"old_{i}", subreddit="stocks", title="Old", created_at=CUTOFF - timedelta(days=1 + i))
+        for i in range(old)
+    ] + [
+        dict(post_id=f"recent_{i}", subreddit="stocks", title="Recent", created_at=CUTOFF + timedelta(hours=i))
+        for i in range(recent)
+    ]
+    async with session_factory() as session:
+        await session.execute(insert(RedditPost), rows)
+        await session.commit()
+
+
+class TestDeleteInChunks:
+    """Verify chunked deletes remove exactly the matching rows"""
+
+    @pytest.mark.parametrize("old", [23, 20, 0], ids=["partial-last-chunk", "exact-multiple", "nothing-to-delete"])
+    async def test_deletes_matching_rows_in_chunks(self, session_factory, old):
+        """Returns the total deleted, stops after a short chunk, keeps newer rows"""
+        await seed(session_factory, old=old, recent=5)
+
+        async with session_factory() as session:
+            execute = session.execute
+            with patch.object(maintenance_tasks, 'CLEANUP_BATCH_SIZE', 10), \
+                    patch.object(session, 'execute', side_effect=execute) as spy:
+                deleted = await maintenance_tasks._delete_in_chunks(
+                    session, RedditPost, RedditPost.created_at < CUTOFF
+                )
+
+            # Full chunks of 10, then one short (possibly empty) chunk ends the loop
+            assert deleted == old
+            assert spy.await_count == old // 10 + 1
+
+            remaining = await session.execute(select(RedditPost.post_id))
+            assert sorted(remaining.scalars()) == [f"recent_{i}" for i in range(5)]
+
+    async def test_each_chunk_is_committed(self, session_factory):
+        """A chunk is durable before the next one runs"""
+        await seed(session_factory, old=15, recent=0)
+
+        async with session_factory() as session:
+            commit = session.commit
+            with patch.object(maintenance_tasks, 'CLEANUP_BATCH_SIZE', 10), \
+                    patch.object(session, 'commit', side_effect=commit) as spy:
+                await maintenance_tasks._delete_in_chunks(session, RedditPost, RedditPost.created_at < CUTOFF)
+
+            assert spy.await_count == 2
+
+        async with session_factory() as session:
+            assert await session.scalar(select(func.count()).select_from(RedditPost)) == 0
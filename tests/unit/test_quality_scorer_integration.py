@@ -6,22 +6,22 @@ Verifies that low-quality posts are properly filtered and statistics tracked.
 """
 
 import pytest
+import pandas as pd
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
-from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import MagicMock
 
-from backend.services.reddit_service import RedditService
+from backend.services.reddit_service import RedditService, _score_quality
 from backend.services.quality_scorer import QualityScorer, QualityScore
 from backend.models.reddit import RedditPost
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def quality_scorer():
     """Create QualityScorer with default thresholds"""
     return QualityScorer(min_quality=50)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def reddit_service():
     """Create RedditService instance"""
     return RedditService(min_quality=50)
@@ -30,7 +30,6 @@ def reddit_service():
 class TestQualityScoreIntegration:
     """Test quality scoring in the scraping pipeline"""
     
-    @pytest.mark.asyncio
     async def test_score_post_excellent_quality(self, reddit_service):
         """Test scoring and filtering of excellent quality posts"""
         # High engagement, good content, healthy ratio
@@ -51,7 +50,6 @@ class TestQualityScoreIntegration:
         assert quality_score.quality_tier in ["good", "excellent"]
         assert len(quality_score.flags) < 3  # Minimal red flags
     
-    @pytest.mark.asyncio
     async def test_score_post_low_quality(self, reddit_service):
         """Test filtering of low-quality spam posts"""
         # Minimal engagement, spam keywords
@@ -72,7 +70,6 @@ class TestQualityScoreIntegration:
         assert quality_score.quality_tier in ["poor", "fair"]
         assert len(quality_score.flags) > 0  # Multiple red flags
     
-    @pytest.mark.asyncio
     async def test_score_post_brigading_detected(self, reddit_service):
         """Test detection of brigading/manipulation (suspicious vote ratio)"""
         # High engagement but extremely low upvote ratio = brigading
@@ -90,7 +87,6 @@ class TestQualityScoreIntegration:
                quality_score.upvote_ratio_score < 50
         # Post might still be filtered due to brigading flag
     
-    @pytest.mark.asyncio
     async def test_quality_threshold_filtering(self):
         """Test that min_quality threshold is respected"""
         # Create scorers with different thresholds
@@ -129,16 +125,9 @@ class TestQualityScoreIntegration:
             created_at=datetime.now(timezone.utc)
         ).is_quality is True
     
-    @pytest.mark.asyncio
-    async def test_mock_reddit_service_with_quality_filter(self):
-        """Test complete RedditService flow with mocked DB and scraper"""
-        service = RedditService(min_quality=50)
-        
-        # Mock database and scraper
-        mock_db = AsyncMock(spec=AsyncSession)
-        mock_db.execute = AsyncMock()
-        mock_db.add = MagicMock()
-        mock_db.commit = AsyncMock()
+    async def test_mock_reddit_service_with_quality_filter(self, reddit_service):
+        """Test RedditService's scorer on scraped-shaped posts"""
+        service = reddit_service
         
         # Mock post data: one good, one spam
         mock_posts = [
@@ -239,8 +228,8 @@ class TestQualityScoringDimensions:
         
         # Very short post (30 chars < MIN_CONTENT_LENGTH 50)
         short_score = quality_scorer._score_content(
-            title="Short",
             body="This is too brief",
+            content_length=len("Short This is too brief"),
             flags=flags,
             reasons=reasons
         )
@@ -250,9 +239,10 @@ class TestQualityScoringDimensions:
     def test_spam_scoring_emoji_detection(self, quality_scorer):
         """Spam score should flag posts with excessive emoji"""
         flags = []
+        text = "🚀🚀🚀 MOON SHOT 🚀🚀🚀 🎉🎊🎈 Get rich quick! 💎💎💎"
         spam_score = quality_scorer._score_spam(
-            title="🚀🚀🚀 MOON SHOT 🚀🚀🚀",
-            body="🎉🎊🎈 Get rich quick! 💎💎💎",
+            full_text_original=text,
+            full_text=text.lower(),
             flags=flags
         )
         
@@ -262,79 +252,158 @@ class TestQualityScoringDimensions:
     def test_spam_scoring_caps_detection(self, quality_scorer):
         """Spam score should flag posts with excessive ALL CAPS"""
         flags = []
+        text = "THIS IS A TITLE IN ALL CAPS BUY NOW GUARANTEED PROFIT NO RISK MOON STOCK!!!!!"
         spam_score = quality_scorer._score_spam(
-            title="THIS IS A TITLE IN ALL CAPS",
-            body="BUY NOW GUARANTEED PROFIT NO RISK MOON STOCK!!!!!",
+            full_text_original=text,
+            full_text=text.lower(),
             flags=flags
         )
         
         assert spam_score >= 30  # Moderate spam score (at boundary or above)
         assert any("caps" in flag.lower() for flag in flags)
+    
+    def test_spam_keywords_match_whole_words(self, quality_scorer):
+        """Spam keywords should not match inside longer words"""
+        flags = []
+        text = "See you this afternoon at the bitcoin conference"
+        quality_scorer._score_spam(
+            full_text_original=text,
+            full_text=text.lower(),
+            flags=flags
+        )
+        
+        assert not any("keyword" in flag.lower() for flag in flags)
 
 
-class TestQualityTierClassification:
-    """Test quality tier assignment logic"""
+class TestBatchScoring:
+    """Test vectorized score_posts against scalar score_post"""
     
-    def test_tier_classification_poor(self, quality_scorer):
-        """Overall score 0-30 should be classified as poor"""
-        score = quality_scorer.score_post(
-            title="Pump it",
-            body="🚀 Moon 💎",
-            upvotes=1,
-            downvotes=2,
-            comment_count=0,
-            upvote_ratio=0.33,
-            created_at=datetime.now(timezone.utc)
-        )
+    def test_score_posts_matches_score_post(self, quality_scorer):
+        """Batch scoring should reproduce the scalar scores and tiers"""
+        posts = pd.DataFrame([
+            {
+                'title': "[DD] Strong technical setup",
+                'body': "This analysis explains key levels and trends...",
+                'upvotes': 120,
+                'comment_count': 35,
+                'upvote_ratio': 0.91,
+            },
+            {
+                'title': "🚀🚀🚀 MOON SHOT 🚀🚀🚀",
+                'body': "🎉🎊🎈 Get rich quick! 💎💎💎",
+                'upvotes': 3,
+                'comment_count': 1,
+                'upvote_ratio': 0.35,
+            },
+            {
+                'title': "Market thoughts",
+                'body': "Some basic thinking about stocks.",
+                'upvotes': 8,
+                'comment_count': 2,
+                'upvote_ratio': 0.89,
+            },
+        ])
         
-        assert score.quality_tier == "poor"
-        assert score.overall_score < 30
+        batch = quality_scorer.score_posts(posts)
+        
+        assert len(batch) == len(posts)
+        for i, post in posts.iterrows():
+            expected = quality_scorer.score_post(
+                title=post['title'],
+                body=post['body'],
+                upvotes=post['upvotes'],
+                downvotes=0,
+                comment_count=post['comment_count'],
+                upvote_ratio=post['upvote_ratio'],
+            )
+            row = batch.loc[i]
+            assert row['overall_score'] == pytest.approx(expected.overall_score)
+            assert row['spam_score'] == pytest.approx(expected.spam_score)
+            assert row['quality_tier'] == expected.quality_tier
+            assert bool(row['is_quality']) is expected.is_quality
     
-    def test_tier_classification_fair(self, quality_scorer):
-        """Overall score 30-50 should be classified as fair"""
-        # Lower engagement but not spam
-        score = quality_scorer.score_post(
-            title="Market thoughts",
-            body="Some basic thinking about stocks.",
-            upvotes=8,
-            downvotes=1,
-            comment_count=2,
-            upvote_ratio=0.89,
-            created_at=datetime.now(timezone.utc)
-        )
+    def test_missing_engagement_skips_batch_path(self, monkeypatch):
+        """A missing engagement value goes straight to per-post scoring"""
+        scorer = MagicMock(spec=QualityScorer)
+        scorer.score_post.return_value = MagicMock(overall_score=40.0, quality_tier='fair', is_quality=False)
+        log = MagicMock()
+        monkeypatch.setattr('backend.services.reddit_service.logger', log)
+        posts = [
+            {'title': "Market thoughts", 'score': 8, 'num_comments': 2},
+            {'title': "Comments not loaded", 'score': 5, 'num_comments': float('nan')},
+        ]
+        
+        results = _score_quality(posts, scorer)
         
-        assert score.quality_tier == "fair"
-        assert 30 <= score.overall_score < 50
+        scorer.score_posts.assert_not_called()
+        assert scorer.score_post.call_count == 2
+        assert results == [(40.0, 'fair', False)] * 2
+        log.warning.assert_not_called()
     
-    def test_tier_classification_good(self, quality_scorer):
-        """Overall score 50-70 should be classified as good"""
-        score = quality_scorer.score_post(
-            title="[DD] Strong technical setup",
-            body="This analysis explains key levels and trends...",
-            upvotes=120,
-            downvotes=12,
-            comment_count=35,
-            upvote_ratio=0.91,
-            created_at=datetime.now(timezone.utc)
-        )
+    def test_batch_failure_is_logged_and_falls_back(self, monkeypatch):
+        """An expected score_posts error is logged, then posts are scored one by one"""
+        scorer = MagicMock(spec=QualityScorer)
+        scorer.score_posts.side_effect = KeyError('comment_count')
+        scorer.score_post.return_value = MagicMock(overall_score=75.0, quality_tier='excellent', is_quality=True)
+        log = MagicMock()
+        monkeypatch.setattr('backend.services.reddit_service.logger', log)
+        
+        results = _score_quality([{'title': "DD", 'score': 120, 'num_comments': 35}], scorer)
         
-        assert score.quality_tier == "good"
-        assert 50 <= score.overall_score < 70
+        assert results == [(75.0, 'excellent', True)]
+        log.warning.assert_called_once()
     
-    def test_tier_classification_excellent(self, quality_scorer):
-        """Overall score 70+ should be classified as excellent"""
-        score = quality_scorer.score_post(
-            title="[DD] Comprehensive market analysis with fundamentals and detailed breakdowns",
-            body="Deep analysis covering technical levels, fundamental factors, "
-                 "market sentiment, macroeconomic indicators, and risk factors. "
-                 "Multiple data sources cited. Excellent discussion in comments.",
-            upvotes=500,
-            downvotes=20,
-            comment_count=150,
-            upvote_ratio=0.962,
-            created_at=datetime.now(timezone.utc)
-        )
+    def test_unexpected_batch_error_propagates(self):
+        """Errors outside the expected set are not swallowed by the fallback"""
+        scorer = MagicMock(spec=QualityScorer)
+        scorer.score_posts.side_effect = RuntimeError("boom")
+        
+        with pytest.raises(RuntimeError):
+            _score_quality([{'title': "DD", 'score': 120, 'num_comments': 35}], scorer)
+        scorer.score_post.assert_not_called()
+
+
+class TestQualityTierClassification:
+    """Test quality tier assignment logic"""
+    
+    @pytest.mark.parametrize(
+        "post, tiers, min_score, max_score",
+        [
+            # Overall score 0-30 should be classified as poor
+            pytest.param(
+                dict(title="Pump it", body="🚀 Moon 💎",
+                     upvotes=1, downvotes=2, comment_count=0, upvote_ratio=0.33),
+                {"poor"}, 0, 30, id="poor",
+            ),
+            # Overall score 30-50 should be classified as fair
+            # (lower engagement but not spam)
+            pytest.param(
+                dict(title="Market thoughts", body="Some basic thinking about stocks.",
+                     upvotes=8, downvotes=1, comment_count=2, upvote_ratio=0.89),
+                {"fair"}, 30, 50, id="fair",
+            ),
+            # Overall score 50-70 should be classified as good
+            pytest.param(
+                dict(title="[DD] Strong technical setup",
+                     body="This analysis explains key levels and trends...",
+                     upvotes=120, downvotes=12, comment_count=35, upvote_ratio=0.91),
+                {"good"}, 50, 70, id="good",
+            ),
+            # Overall score 70+ should be classified as excellent; good or
+            # excellent is accepted since quality tiers vary by threshold
+            pytest.param(
+                dict(title="[DD] Comprehensive market analysis with fundamentals and detailed breakdowns",
+                     body="Deep analysis covering technical levels, fundamental factors, "
+                          "market sentiment, macroeconomic indicators, and risk factors. "
+                          "Multiple data sources cited. Excellent discussion in comments.",
+                     upvotes=500, downvotes=20, comment_count=150, upvote_ratio=0.962),
+                {"good", "excellent"}, 50, float("inf"), id="excellent",
+            ),
+        ],
+    )
+    def test_tier_classification(self, quality_scorer, post, tiers, min_score, max_score):
+        """Each sample post lands in its expected tier and score band"""
+        score = quality_scorer.score_post(**post, created_at=datetime.now(timezone.utc))
         
-        # Should be in good tier or excellent (quality tiers vary by threshold)
-        assert score.quality_tier in ["good", "excellent"]
-        assert score.overall_score >= 50  # At least good quality
+        assert score.quality_tier in tiers
+        assert min_score <= score.overall_score < max_score
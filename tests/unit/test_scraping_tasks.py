@@ -0,0 +1,52 @@
+"""
+Tests for the scheduled stock-fetch watchlist.
+
+Trending tickers come from every scraper, including bare NSE symbols from
+the India RSS feeds; only yfinance-ready symbols may reach the fetch task.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.tasks import scraping_tasks
+
+
+@pytest.fixture
+def trending(monkeypatch):
+    """Patch get_redis with a cache whose trending list the test sets."""
+    cache = AsyncMock()
+    monkeypatch.setattr(scraping_tasks, 'get_redis', AsyncMock(return_value=cache))
+    return cache.get_trending
+
+
+class TestScheduledWatchlist:
+    """Verify trending tickers are merged into the default watchlist"""
+
+    async def test_mixed_trending_list(self, trending):
+        """US names are added as-is, NSE names get .NS, duplicates are dropped"""
+        from backend.strategy.signal_engine import DEFAULT_WATCHLIST
+
+        trending.return_value = [
+            {'ticker': 'AAPL', 'mentions': 40},        # already watched
+            {'ticker': 'PLTR', 'mentions': 30},        # new US name
+            {'ticker': 'RELIANCE', 'mentions': 20},    # watched as RELIANCE.NS
+            {'ticker': 'LT', 'mentions': 15},          # watched as LT.NS
+            {'ticker': 'WIPRO', 'mentions': 10},       # new NSE name
+            {'ticker': 'PLTR', 'mentions': 5},
+            {'mentions': 3},
+        ]
+
+        watchlist = await scraping_tasks._scheduled_watchlist()
+
+        assert watchlist == [*DEFAULT_WATCHLIST, 'PLTR', 'WIPRO.NS']
+        assert 'RELIANCE' not in watchlist
+        assert 'LT' not in watchlist
+
+    async def test_empty_cache_uses_default_watchlist(self, trending):
+        """No trending data leaves the default watchlist unchanged"""
+        from backend.strategy.signal_engine import DEFAULT_WATCHLIST
+
+        trending.return_value = None
+
+        assert await scraping_tasks._scheduled_watchlist() == list(DEFAULT_WATCHLIST)
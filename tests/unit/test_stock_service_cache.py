@@ -0,0 +1,173 @@
+"""
+Tests for StockService's process-local TTL cache.
+
+Covers expiry, the entry bound, that cached dicts are never shared with
+callers, and the local -> Redis -> DB lookup order of get_latest_prices.
+"""
+
+from collections import OrderedDict
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.cache.redis_client import CacheKeys, RedisCache
+from backend.services import stock_service
+from backend.services.stock_service import StockService
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Empty cache and a controllable monotonic clock."""
+    now = [1000.0]
+    monkeypatch.setattr(StockService, '_local_cache', OrderedDict())
+    monkeypatch.setattr(stock_service.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def redis_store(monkeypatch):
+    """Patch get_redis with a connected RedisCache over an in-memory dict."""
+    store = {}
+    client = AsyncMock()
+    client.mget.side_effect = lambda keys: [store.get(k) for k in keys]
+    client.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+    cache = RedisCache()
+    cache._client = client
+    cache._connected = True
+    monkeypatch.setattr(stock_service, 'get_redis', AsyncMock(return_value=cache))
+    return store
+
+
+def latest_closes_db(rows):
+    """Session whose _LATEST_CLOSES query returns (ticker, close) rows."""
+    db = AsyncMock()
+    db.execute.return_value = MagicMock(all=MagicMock(return_value=rows))
+    return db
+
+
+class TestLocalCache:
+    """Verify the local cache stays bounded and private"""
+
+    def test_entry_expires_after_ttl(self, clock):
+        """Entries are dropped once LOCAL_CACHE_SECONDS have passed"""
+        StockService._local_set('price:AAPL', 150.0)
+        assert StockService._local_get('price:AAPL') == 150.0
+
+        clock[0] += StockService.LOCAL_CACHE_SECONDS
+        assert StockService._local_get('price:AAPL') is None
+        assert 'price:AAPL' not in StockService._local_cache
+
+    def test_write_drops_expired_entries(self, clock):
+        """A write prunes expired entries even if they are never read again"""
+        StockService._local_set('price:AAPL', 150.0)
+        StockService._local_set('price:MSFT', 300.0)
+
+        clock[0] += StockService.LOCAL_CACHE_SECONDS
+        StockService._local_set('price:TSLA', 200.0)
+
+        assert list(StockService._local_cache) == ['price:TSLA']
+
+    def test_write_evicts_oldest_beyond_max_entries(self, clock, monkeypatch):
+        """The cache never holds more than LOCAL_CACHE_MAX_ENTRIES"""
+        monkeypatch.setattr(StockService, 'LOCAL_CACHE_MAX_ENTRIES', 2)
+        for ticker in ('AAPL', 'MSFT', 'TSLA'):
+            StockService._local_set(f'price:{ticker}', 1.0)
+
+        assert list(StockService._local_cache) == ['price:MSFT', 'price:TSLA']
+
+    def test_rewrite_refreshes_position(self, clock, monkeypatch):
+        """Re-caching a key moves it to the back of the eviction order"""
+        monkeypatch.setattr(StockService, 'LOCAL_CACHE_MAX_ENTRIES', 2)
+        StockService._local_set('price:AAPL', 1.0)
+        StockService._local_set('price:MSFT', 1.0)
+        StockService._local_set('price:AAPL', 2.0)
+        StockService._local_set('price:TSLA', 1.0)
+
+        assert list(StockService._local_cache) == ['price:AAPL', 'price:TSLA']
+        assert StockService._local_get('price:AAPL') == 2.0
+
+    def test_cached_dicts_are_copied(self, clock):
+        """Callers never share the cached dict"""
+        signals = {'ticker': 'AAPL', 'rsi': 55.0}
+        StockService._local_set('signals:AAPL', signals)
+
+        # Mutating the original or a returned copy leaves the cache intact
+        signals['rsi'] = 0.0
+        first = StockService._local_get('signals:AAPL')
+        first['rsi'] = 99.0
+
+        assert StockService._local_get('signals:AAPL') == {'ticker': 'AAPL', 'rsi': 55.0}
+
+
+class TestLatestPrices:
+    """Verify get_latest_prices serves each ticker from the first layer that has it"""
+
+    async def test_local_hit_skips_redis_and_db(self, clock, redis_store):
+        """Tickers in the local cache never reach Redis or the DB"""
+        StockService._local_set(CacheKeys.stock_price('AAPL'), 150.0)
+        db = latest_closes_db([])
+
+        prices = await StockService().get_latest_prices(['aapl'], db)
+
+        assert prices == {'AAPL': 150.0}
+        stock_service.get_redis.assert_not_awaited()
+        db.execute.assert_not_awaited()
+
+    async def test_redis_hit_skips_db_and_fills_local(self, clock, redis_store):
+        """A Redis hit is served without a DB query and cached locally"""
+        redis_store[CacheKeys.stock_price('MSFT')] = '300.5'
+        db = latest_closes_db([])
+
+        prices = await StockService().get_latest_prices(['MSFT'], db)
+
+        assert prices == {'MSFT': 300.5}
+        db.execute.assert_not_awaited()
+        assert StockService._local_get(CacheKeys.stock_price('MSFT')) == 300.5
+
+    async def test_db_results_written_back_to_both_caches(self, clock, redis_store):
+        """Only tickers missed by both caches are queried; results are cached"""
+        StockService._local_set(CacheKeys.stock_price('AAPL'), 150.0)
+        redis_store[CacheKeys.stock_price('MSFT')] = '300.5'
+        db = latest_closes_db([('TSLA', 200.0), ('NEW', None)])
+
+        prices = await StockService().get_latest_prices(['AAPL', 'MSFT', 'TSLA', 'NEW'], db)
+
+        assert prices == {'AAPL': 150.0, 'MSFT': 300.5, 'TSLA': 200.0}
+        db.execute.assert_awaited_once()
+        assert sorted(db.execute.await_args.args[1]['tickers']) == ['NEW', 'TSLA']
+        assert redis_store[CacheKeys.stock_price('TSLA')] == '200.0'
+        assert StockService._local_get(CacheKeys.stock_price('TSLA')) == 200.0
+        # No stored close: nothing cached, so the next call asks the DB again
+        assert CacheKeys.stock_price('NEW') not in redis_store
+        assert StockService._local_get(CacheKeys.stock_price('NEW')) is None
+
+    async def test_expired_local_entry_falls_through(self, clock, redis_store):
+        """Once the local entry expires, Redis serves the fresher price"""
+        StockService._local_set(CacheKeys.stock_price('AAPL'), 150.0)
+        redis_store[CacheKeys.stock_price('AAPL')] = '151.0'
+        clock[0] += StockService.LOCAL_CACHE_SECONDS
+
+        prices = await StockService().get_latest_prices(['AAPL'], latest_closes_db([]))
+
+        assert prices == {'AAPL': 151.0}
+
+
+class TestRedisStockPrices:
+    """Verify RedisCache.get_stock_prices"""
+
+    async def test_returns_hits_only(self, redis_store):
+        """One MGET; misses are left out and values come back as floats"""
+        redis_store[CacheKeys.stock_price('AAPL')] = '150.25'
+        cache = await stock_service.get_redis()
+
+        assert await cache.get_stock_prices(['AAPL', 'MSFT']) == {'AAPL': 150.25}
+        cache._client.mget.assert_awaited_once()
+
+    async def test_unavailable_cache_returns_empty(self, redis_store):
+        """A disconnected cache or a failing MGET is a miss, not an error"""
+        cache = await stock_service.get_redis()
+        cache._client.mget.side_effect = ConnectionError("reset")
+        assert await cache.get_stock_prices(['AAPL']) == {}
+
+        cache._connected = False
+        assert await cache.get_stock_prices(['AAPL']) == {}
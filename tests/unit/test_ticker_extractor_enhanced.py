@@ -17,6 +17,11 @@ from backend.utils.ticker_extractor import (
 )
 
 
+# Performance inputs, built once at import rather than inside each test
+LONG_TEXT = 'word ' * 10000 + '$AAPL $MSFT'
+REPEATED_TICKER_TEXT = '$AAPL ' * 1000
+
+
 class TestBlacklistFiltering:
     """Test that common English words are filtered out"""
     
@@ -238,8 +243,7 @@ class TestPerformance:
     
     def test_extraction_speed_long_text(self):
         """Extraction should be fast even on long text"""
-        long_text = ' '.join(['word'] * 10000 + ['$AAPL', '$MSFT'])
-        result = extract_tickers(long_text)
+        result = extract_tickers(LONG_TEXT)
         assert set(result) == {'AAPL', 'MSFT'}
     
     def test_many_tickers(self):
@@ -253,8 +257,7 @@ class TestPerformance:
     
     def test_repeated_tickers(self):
         """Many repetitions of same ticker"""
-        text = '$AAPL ' * 1000
-        result = extract_tickers(text)
+        result = extract_tickers(REPEATED_TICKER_TEXT)
         assert result == ['AAPL']
 
 